@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from sqlalchemy import (
     Boolean,
@@ -135,16 +135,34 @@ class LoanApplication(Base, UUIDMixin, TimestampMixin):
         """Check if application is currently being processed."""
         return self.status == "processing"
 
+    @staticmethod
+    def status_values(status: str) -> Optional[dict[str, Any]]:
+        """Column values for moving an application to the given status.
+
+        Terminal statuses (completed, error) also stamp processed_at.
+
+        Returns:
+            The values to set, or None if the status is not recognised.
+        """
+        if status == "processing":
+            return {"status": status}
+        if status in ("completed", "error"):
+            return {"status": status, "processed_at": datetime.now()}
+        return None
+
+    def _apply_status(self, status: str) -> None:
+        """Set the column values for a status transition on this instance."""
+        for key, value in (self.status_values(status) or {}).items():
+            setattr(self, key, value)
+
     def mark_processing(self) -> None:
         """Mark application as processing."""
-        self.status = "processing"
+        self._apply_status("processing")
 
     def mark_completed(self) -> None:
         """Mark application as completed."""
-        self.status = "completed"
-        self.processed_at = datetime.now()
+        self._apply_status("completed")
 
     def mark_error(self) -> None:
         """Mark application as errored."""
-        self.status = "error"
-        self.processed_at = datetime.now()
+        self._apply_status("error")
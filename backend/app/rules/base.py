@@ -2,17 +2,31 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from operator import attrgetter
+from typing import Any, ClassVar, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EvaluationContext:
     """Contains all data needed for rule evaluation.
 
     This dataclass assembles data from the database models into a flat
-    structure that rules can easily access for evaluation.
+    structure that rules can easily access for evaluation. Instances are
+    immutable so they can be safely shared and cached; use
+    dataclasses.replace() to derive a modified copy.
     """
 
+    _TRUCKING_CATEGORIES: ClassVar[frozenset[str]] = frozenset(
+        {"class_8_truck", "trailer", "semi", "truck"}
+    )
+    _SCORE_GETTERS: ClassVar[dict[str, attrgetter]] = {
+        "fico": attrgetter("fico_score"),
+        "transunion": attrgetter("transunion_score"),
+        "experian": attrgetter("experian_score"),
+        "equifax": attrgetter("equifax_score"),
+        "paynet": attrgetter("paynet_score"),
+    }
+
     # Application Reference
     application_id: str
 
@@ -32,7 +46,7 @@ class EvaluationContext:
     years_in_business: float = 0.0
     industry_code: str = ""
     industry_name: str = ""
-    state: str = ""
+    state: str = ""  # Two-letter code, uppercased by the context builder
     annual_revenue: Optional[int] = None
     fleet_size: Optional[int] = None
 
@@ -62,7 +76,7 @@ class EvaluationContext:
     is_private_party: bool = False
 
     # Equipment
-    equipment_category: str = ""
+    equipment_category: str = ""  # Lowercased by the context builder
     equipment_type: str = ""
     equipment_year: int = 0
     equipment_age_years: int = 0
@@ -72,20 +86,13 @@ class EvaluationContext:
 
     def get_credit_score(self, score_type: str) -> Optional[int]:
         """Get a specific credit score by type."""
-        score_map = {
-            "fico": self.fico_score,
-            "transunion": self.transunion_score,
-            "experian": self.experian_score,
-            "equifax": self.equifax_score,
-            "paynet": self.paynet_score,
-        }
-        return score_map.get(score_type.lower())
+        getter = self._SCORE_GETTERS.get(score_type.lower())
+        return getter(self) if getter else None
 
     @property
     def is_trucking(self) -> bool:
         """Check if this is a trucking-related application."""
-        trucking_categories = {"class_8_truck", "trailer", "semi", "truck"}
-        return self.equipment_category.lower() in trucking_categories
+        return self.equipment_category.lower() in self._TRUCKING_CATEGORIES
 
     @property
     def is_startup(self) -> bool:
@@ -93,11 +100,12 @@ class EvaluationContext:
         return self.years_in_business < 2.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class RuleResult:
     """Output of a rule evaluation.
 
     Contains all information about whether a rule passed and why.
+    Results compare by identity; use is_equivalent for a field-wise check.
     """
 
     passed: bool
@@ -111,9 +119,21 @@ class RuleResult:
     def __post_init__(self):
         """Validate score bounds."""
         if self.score < 0:
-            self.score = 0
+            object.__setattr__(self, "score", 0)
         elif self.score > 100:
-            self.score = 100
+            object.__setattr__(self, "score", 100)
+
+    def is_equivalent(self, other: "RuleResult") -> bool:
+        """Check whether another result has the same field values."""
+        return (
+            self.passed == other.passed
+            and self.rule_name == other.rule_name
+            and self.required_value == other.required_value
+            and self.actual_value == other.actual_value
+            and self.message == other.message
+            and self.score == other.score
+            and self.details == other.details
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
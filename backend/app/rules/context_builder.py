@@ -1,10 +1,34 @@
 """Context builder for transforming database models to EvaluationContext."""
 
-from datetime import datetime
+import sys
+import time
+from datetime import date
 from typing import Any, Optional
 
 from app.rules.base import EvaluationContext
 
+# Derived features that may override values mapped from the raw data.
+_DERIVED_FEATURE_KEYS = frozenset(
+    {"equipment_age_years", "years_in_business", "bankruptcy_discharge_years"}
+)
+
+# The current year is re-read from the wall clock at most once per TTL so
+# bulk context building does not hit the clock for every application,
+# while long-running workers still pick up a year change.
+_CURRENT_YEAR_TTL_SECONDS = 60.0
+_current_year_cache: tuple[float, int] = (float("-inf"), 0)
+
+
+def _current_year() -> int:
+    """Return the current calendar year, cached for a short TTL."""
+    global _current_year_cache
+    expires_at, year = _current_year_cache
+    now = time.monotonic()
+    if now >= expires_at:
+        year = date.today().year
+        _current_year_cache = (now + _CURRENT_YEAR_TTL_SECONDS, year)
+    return year
+
 
 def build_evaluation_context(
     application_id: str,
@@ -33,6 +57,17 @@ def build_evaluation_context(
     Returns:
         Populated EvaluationContext ready for rule evaluation.
     """
+    # Nothing to map: every field takes its dataclass default.
+    if not (
+        business
+        or guarantor
+        or business_credit
+        or loan_request
+        or equipment
+        or derived_features
+    ):
+        return EvaluationContext(application_id=application_id)
+
     business = business or {}
     guarantor = guarantor or {}
     business_credit = business_credit or {}
@@ -40,72 +75,71 @@ def build_evaluation_context(
     equipment = equipment or {}
     derived_features = derived_features or {}
 
-    # Calculate equipment age if not provided
+    # Calculate equipment age (derived features may override it below)
     equipment_year = equipment.get("year", 0)
-    current_year = datetime.now().year
-    equipment_age = derived_features.get(
-        "equipment_age_years",
-        max(0, current_year - equipment_year) if equipment_year else 0,
+    equipment_age = (
+        max(0, _current_year() - equipment_year) if equipment_year else 0
     )
 
-    # Calculate years in business if not provided
-    years_in_business = derived_features.get(
-        "years_in_business", business.get("years_in_business", 0.0)
-    )
+    # Store comparison fields in a canonical case; consumers still normalize
+    # so contexts built by hand compare the same way.
+    equipment_category = sys.intern((equipment.get("category") or "").lower())
+    state = sys.intern((business.get("state") or "").upper())
 
-    # Calculate bankruptcy discharge years if applicable
-    bankruptcy_discharge_years = derived_features.get(
-        "bankruptcy_discharge_years", guarantor.get("bankruptcy_discharge_years")
-    )
-
-    return EvaluationContext(
+    fields: dict[str, Any] = {
         # Application Reference
-        application_id=application_id,
+        "application_id": application_id,
         # Credit Scores (Personal)
-        fico_score=guarantor.get("fico_score"),
-        transunion_score=guarantor.get("transunion_score"),
-        experian_score=guarantor.get("experian_score"),
-        equifax_score=guarantor.get("equifax_score"),
+        "fico_score": guarantor.get("fico_score"),
+        "transunion_score": guarantor.get("transunion_score"),
+        "experian_score": guarantor.get("experian_score"),
+        "equifax_score": guarantor.get("equifax_score"),
         # Credit Scores (Business)
-        paynet_score=business_credit.get("paynet_score"),
-        paynet_master_score=business_credit.get("paynet_master_score"),
-        paydex_score=business_credit.get("paydex_score"),
+        "paynet_score": business_credit.get("paynet_score"),
+        "paynet_master_score": business_credit.get("paynet_master_score"),
+        "paydex_score": business_credit.get("paydex_score"),
         # Business Info
-        business_name=business.get("name", ""),
-        years_in_business=years_in_business,
-        industry_code=business.get("industry_code", ""),
-        industry_name=business.get("industry_name", ""),
-        state=business.get("state", ""),
-        annual_revenue=business.get("annual_revenue"),
-        fleet_size=business.get("fleet_size"),
+        "business_name": business.get("name", ""),
+        "years_in_business": business.get("years_in_business", 0.0),
+        "industry_code": business.get("industry_code", ""),
+        "industry_name": business.get("industry_name", ""),
+        "state": state,
+        "annual_revenue": business.get("annual_revenue"),
+        "fleet_size": business.get("fleet_size"),
         # Guarantor Info
-        is_homeowner=guarantor.get("is_homeowner", False),
-        is_us_citizen=guarantor.get("is_us_citizen", True),
-        has_cdl=guarantor.get("has_cdl", False),
-        cdl_years=guarantor.get("cdl_years"),
-        industry_experience_years=guarantor.get("industry_experience_years"),
+        "is_homeowner": guarantor.get("is_homeowner", False),
+        "is_us_citizen": guarantor.get("is_us_citizen", True),
+        "has_cdl": guarantor.get("has_cdl", False),
+        "cdl_years": guarantor.get("cdl_years"),
+        "industry_experience_years": guarantor.get("industry_experience_years"),
         # Credit History
-        has_bankruptcy=guarantor.get("has_bankruptcy", False),
-        bankruptcy_discharge_years=bankruptcy_discharge_years,
-        bankruptcy_chapter=guarantor.get("bankruptcy_chapter"),
-        has_open_judgements=guarantor.get("has_open_judgements", False),
-        judgement_amount=guarantor.get("judgement_amount"),
-        has_foreclosure=guarantor.get("has_foreclosure", False),
-        has_repossession=guarantor.get("has_repossession", False),
-        has_tax_liens=guarantor.get("has_tax_liens", False),
-        tax_lien_amount=guarantor.get("tax_lien_amount"),
+        "has_bankruptcy": guarantor.get("has_bankruptcy", False),
+        "bankruptcy_discharge_years": guarantor.get("bankruptcy_discharge_years"),
+        "bankruptcy_chapter": guarantor.get("bankruptcy_chapter"),
+        "has_open_judgements": guarantor.get("has_open_judgements", False),
+        "judgement_amount": guarantor.get("judgement_amount"),
+        "has_foreclosure": guarantor.get("has_foreclosure", False),
+        "has_repossession": guarantor.get("has_repossession", False),
+        "has_tax_liens": guarantor.get("has_tax_liens", False),
+        "tax_lien_amount": guarantor.get("tax_lien_amount"),
         # Loan Request
-        loan_amount=loan_request.get("loan_amount", 0),
-        requested_term_months=loan_request.get("requested_term_months"),
-        down_payment_percent=loan_request.get("down_payment_percent"),
-        transaction_type=loan_request.get("transaction_type", "purchase"),
-        is_private_party=loan_request.get("is_private_party", False),
+        "loan_amount": loan_request.get("loan_amount", 0),
+        "requested_term_months": loan_request.get("requested_term_months"),
+        "down_payment_percent": loan_request.get("down_payment_percent"),
+        "transaction_type": loan_request.get("transaction_type", "purchase"),
+        "is_private_party": loan_request.get("is_private_party", False),
         # Equipment
-        equipment_category=equipment.get("category", ""),
-        equipment_type=equipment.get("type", ""),
-        equipment_year=equipment_year,
-        equipment_age_years=equipment_age,
-        equipment_mileage=equipment.get("mileage"),
-        equipment_hours=equipment.get("hours"),
-        equipment_condition=equipment.get("condition", "used"),
-    )
+        "equipment_category": equipment_category,
+        "equipment_type": equipment.get("type", ""),
+        "equipment_year": equipment_year,
+        "equipment_age_years": equipment_age,
+        "equipment_mileage": equipment.get("mileage"),
+        "equipment_hours": equipment.get("hours"),
+        "equipment_condition": equipment.get("condition", "used"),
+    }
+
+    # Pre-computed derived features override the mapped values
+    for key in derived_features.keys() & _DERIVED_FEATURE_KEYS:
+        fields[key] = derived_features[key]
+
+    return EvaluationContext(**fields)
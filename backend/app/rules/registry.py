@@ -39,6 +39,24 @@ class RuleRegistry:
 
         return decorator
 
+    @classmethod
+    def register_many(cls, rules: dict[str, Type[Rule]]) -> None:
+        """Register several rule classes in one update.
+
+        Every class is validated before any is registered, so a bad entry
+        leaves the registry unchanged.
+
+        Args:
+            rules: Mapping of type identifier to rule class.
+
+        Raises:
+            TypeError: If any class is not a subclass of Rule.
+        """
+        for rule_class in rules.values():
+            if not issubclass(rule_class, Rule):
+                raise TypeError(f"{rule_class.__name__} must be a subclass of Rule")
+        cls._rules.update(rules)
+
     @classmethod
     def get_rule(cls, name: str) -> Rule:
         """Get a rule instance by name.
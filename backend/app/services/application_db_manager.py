@@ -4,7 +4,7 @@ from datetime import date, timedelta
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -118,17 +118,22 @@ class ApplicationDBManager:
         return application
 
     async def update_status(self, application_id: UUID, status: str) -> None:
-        """Update application status using SQLAlchemy."""
-        stmt = select(LoanApplication).where(LoanApplication.id == application_id)
-        result = await self.db.execute(stmt)
-        app = result.scalar_one_or_none()
-        if app:
-            if status == "processing":
-                app.mark_processing()
-            elif status == "completed":
-                app.mark_completed()
-            elif status == "error":
-                app.mark_error()
+        """Update application status with a single UPDATE.
+
+        The column values come from LoanApplication.status_values, so the
+        transition rules match mark_completed/mark_error. Unknown statuses
+        are ignored.
+        """
+        values = LoanApplication.status_values(status)
+        if values is None:
+            return
+
+        stmt = (
+            update(LoanApplication)
+            .where(LoanApplication.id == application_id)
+            .values(**values)
+        )
+        await self.db.execute(stmt)
 
     async def sync_lenders(self, policies: list[LenderPolicy]) -> None:
         """Ensure all lenders from policies exist in database.
@@ -137,13 +142,16 @@ class ApplicationDBManager:
         constraint violations. Performs upsert: creates new lenders or updates
         existing ones if policy version changed.
         """
+        # Load every known lender in one query; a per-policy SELECT would
+        # autoflush the previous pending INSERT and defeat batching.
+        stmt = select(Lender).where(Lender.id.in_([p.id for p in policies]))
+        lenders = {lender.id: lender for lender in (await self.db.scalars(stmt))}
+
         for policy in policies:
-            stmt = select(Lender).where(Lender.id == policy.id)
-            result = await self.db.execute(stmt)
-            existing = result.scalar_one_or_none()
+            existing = lenders.get(policy.id)
 
             if not existing:
-                lender = Lender(
+                lender = lenders[policy.id] = Lender(
                     id=policy.id,
                     name=policy.name,
                     is_active=True,
@@ -208,23 +216,30 @@ class ApplicationDBManager:
     async def list_applications(
         self, skip: int, limit: int
     ) -> tuple[list[LoanApplication], int]:
-        """List applications with pagination using SQLAlchemy."""
-        # Count total
-        count_stmt = select(func.count()).select_from(LoanApplication)
-        total = (await self.db.execute(count_stmt)).scalar() or 0
+        """List applications with pagination using SQLAlchemy.
 
-        # Fetch page with eager loading
+        The total is computed with a COUNT(*) OVER () window on the page query,
+        so a non-empty page costs one round-trip instead of two.
+        """
+        # Fetch page with eager loading and the unpaginated total
         stmt = (
-            select(LoanApplication)
+            select(LoanApplication, func.count().over().label("total"))
             .options(selectinload(LoanApplication.business))
             .order_by(LoanApplication.created_at.desc())
             .offset(skip)
             .limit(limit)
         )
-        result = await self.db.execute(stmt)
-        applications = list(result.scalars().all())
+        rows = (await self.db.execute(stmt)).all()
+        if rows:
+            return [row.LoanApplication for row in rows], rows[0].total
 
-        return applications, total
+        # An empty page carries no window total; only a page past the end
+        # can be empty while rows exist, so count separately then.
+        if skip == 0:
+            return [], 0
+        count_stmt = select(func.count()).select_from(LoanApplication)
+        total = (await self.db.execute(count_stmt)).scalar() or 0
+        return [], total
 
     async def get_match_results(self, application_id: UUID) -> list[MatchResult]:
         """Retrieve match results using SQLAlchemy with lender eager loading."""
@@ -8,11 +8,9 @@ import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import (
-    AsyncSession,
-    async_sessionmaker,
-    create_async_engine,
-)
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from app.core.database import Base, get_db
 from app.main import app
@@ -22,39 +20,122 @@ from app.main import app
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register custom command line options."""
+    parser.addoption(
+        "--smoke",
+        action="store_true",
+        default=False,
+        help="Run only the first case of each parametrized test.",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Run async tests on the session loop; subsample under --smoke.
+
+    The engine is session-scoped, so every async test shares its loop.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+    if not config.getoption("--smoke"):
+        return
+
+    seen: set[tuple[str, str]] = set()
+    selected: list[pytest.Item] = []
+    deselected: list[pytest.Item] = []
+    for item in items:
+        if not hasattr(item, "callspec"):
+            selected.append(item)
+            continue
+        key = (item.parent.nodeid, item.originalname)
+        if key in seen:
+            deselected.append(item)
+        else:
+            seen.add(key)
+            selected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
 @pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create an event loop for the test session."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the async tests on uvloop where it is installed.
 
+    uvloop is an optional dev dependency (not available on Windows), so the
+    default asyncio policy is used when it cannot be imported.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
-@pytest_asyncio.fixture(scope="function")
+
+def _enable_sqlite_savepoints(engine: AsyncEngine) -> None:
+    """Let SQLAlchemy, not the sqlite3 driver, control transactions.
+
+    The driver defers BEGIN until the first DML statement, which breaks
+    SAVEPOINT rollback. Disabling its handling and emitting BEGIN ourselves
+    is the workaround from the SQLAlchemy SQLite dialect docs.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+@pytest_asyncio.fixture(scope="session")
 async def test_engine():
-    """Create a test database engine."""
+    """Create the test database engine and schema once per session."""
+    # One in-memory database shared by every checkout: StaticPool keeps a
+    # single connection alive instead of relying on the dialect default.
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+        query_cache_size=1200,
     )
+    # Guard against a dialect change silently disabling statement caching.
+    assert engine.sync_engine.dialect.supports_statement_cache is True
+    _enable_sqlite_savepoints(engine)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield engine
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
     await engine.dispose()
 
 
 @pytest_asyncio.fixture(scope="function")
 async def test_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
-    session_factory = async_sessionmaker(
-        test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-    async with session_factory() as session:
-        yield session
+    """Create a test database session rolled back at teardown.
+
+    The session is bound to a connection inside an outer transaction and
+    turns its own commits into SAVEPOINT releases, so tests may commit
+    freely and still leave the shared schema empty for the next test.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -1,6 +1,5 @@
 """Unit tests for lender API endpoints."""
 
-import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
@@ -1,6 +1,5 @@
 """Tests for the database module."""
 
-import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import Base, async_session_factory, engine
@@ -4,8 +4,6 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 
-import pytest
-
 from app.models import Business, LoanApplication, PersonalGuarantor
 
 
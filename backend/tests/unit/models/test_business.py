@@ -2,8 +2,6 @@
 
 from decimal import Decimal
 
-import pytest
-
 from app.models import Business
 
 
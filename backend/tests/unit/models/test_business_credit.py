@@ -3,8 +3,6 @@
 import uuid
 from datetime import date
 
-import pytest
-
 from app.models import BusinessCredit
 
 
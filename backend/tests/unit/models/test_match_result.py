@@ -3,8 +3,6 @@
 import uuid
 from datetime import datetime
 
-import pytest
-
 from app.models import MatchResult
 
 
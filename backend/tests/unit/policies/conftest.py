@@ -0,0 +1,23 @@
+"""Fixtures for policy tests."""
+
+import pytest
+
+from app.policies.schema import (
+    BusinessCriteria,
+    CreditHistoryCriteria,
+    CreditScoreCriteria,
+    GeographicCriteria,
+    LenderProgram,
+    ScoringConfig,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_schemas() -> None:
+    """Validate each policy model once so first-use cost is paid at setup."""
+    ScoringConfig()
+    BusinessCriteria()
+    CreditHistoryCriteria()
+    GeographicCriteria()
+    LenderProgram(id="p1", name="P1")
+    CreditScoreCriteria(min=700)
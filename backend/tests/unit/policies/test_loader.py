@@ -1,5 +1,6 @@
 """Unit tests for policy loader."""
 
+import os
 import tempfile
 from pathlib import Path
 
@@ -8,6 +9,35 @@ import yaml
 
 from app.policies.loader import PolicyLoader, PolicyLoadError
 
+# Resolve the dumper once; the libyaml-backed one is used when available.
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Shared programs skeleton for dict-based fixtures; only ever serialized.
+_PROGRAMS = [{"id": "p1", "name": "P1"}]
+
+
+def _dump_yaml(data: dict) -> bytes:
+    """Serialize policy data to UTF-8 YAML with the cached dumper class."""
+    return yaml.dump(data, Dumper=_YAML_DUMPER).encode()
+
+
+def _make_policy_yaml(lender_id: str, version: int = 1) -> bytes:
+    """Build a minimal valid policy document without a dict/emitter round trip."""
+    return (
+        f"id: {lender_id}\n"
+        f'name: "Lender {lender_id}"\n'
+        f"version: {version}\n"
+        "programs:\n"
+        "  - id: p1\n"
+        "    name: P1\n"
+    ).encode()
+
+
+def _create_empty_file(path: Path) -> None:
+    """Create an empty file without the extra utime call made by Path.touch()."""
+    fd = os.open(str(path), os.O_CREAT | os.O_WRONLY, 0o644)
+    os.close(fd)
+
 
 class TestLoadSinglePolicy:
     """Tests for loading a single policy."""
@@ -24,8 +54,7 @@ class TestLoadSinglePolicy:
             ],
         }
         policy_file = tmp_path / "test_lender.yaml"
-        with open(policy_file, "w") as f:
-            yaml.dump(policy_data, f)
+        policy_file.write_bytes(_dump_yaml(policy_data))
 
         loader = PolicyLoader(tmp_path)
         policy = loader.load_policy("test_lender")
@@ -51,8 +80,7 @@ class TestLoadInvalidPolicy:
     def test_load_invalid_yaml_syntax(self, tmp_path):
         """Test loading a file with invalid YAML syntax."""
         policy_file = tmp_path / "bad_yaml.yaml"
-        with open(policy_file, "w") as f:
-            f.write("id: test\n  invalid: yaml: syntax:")
+        policy_file.write_bytes(b"id: test\n  invalid: yaml: syntax:")
 
         loader = PolicyLoader(tmp_path)
 
@@ -70,8 +98,7 @@ class TestLoadInvalidPolicy:
             "programs": [],
         }
         policy_file = tmp_path / "test_lender.yaml"
-        with open(policy_file, "w") as f:
-            yaml.dump(policy_data, f)
+        policy_file.write_bytes(_dump_yaml(policy_data))
 
         loader = PolicyLoader(tmp_path)
 
@@ -98,11 +125,10 @@ class TestLoadInvalidPolicy:
             "id": "wrong_id",
             "name": "Test Lender",
             "version": 1,
-            "programs": [{"id": "p1", "name": "P1"}],
+            "programs": _PROGRAMS,
         }
         policy_file = tmp_path / "test_lender.yaml"
-        with open(policy_file, "w") as f:
-            yaml.dump(policy_data, f)
+        policy_file.write_bytes(_dump_yaml(policy_data))
 
         loader = PolicyLoader(tmp_path)
 
@@ -117,9 +143,8 @@ class TestGetAllLenders:
 
     def test_get_all_lender_ids(self, tmp_path):
         """Test getting list of all lender IDs."""
-        for name in ["lender_a", "lender_b", "lender_c"]:
-            policy_file = tmp_path / f"{name}.yaml"
-            policy_file.touch()
+        for name in ("lender_a", "lender_b", "lender_c"):
+            _create_empty_file(tmp_path / f"{name}.yaml")
 
         loader = PolicyLoader(tmp_path)
         ids = loader.get_all_lender_ids()
@@ -128,8 +153,8 @@ class TestGetAllLenders:
 
     def test_excludes_template_files(self, tmp_path):
         """Test that template files are excluded."""
-        (tmp_path / "_template.yaml").touch()
-        (tmp_path / "lender_a.yaml").touch()
+        _create_empty_file(tmp_path / "_template.yaml")
+        _create_empty_file(tmp_path / "lender_a.yaml")
 
         loader = PolicyLoader(tmp_path)
         ids = loader.get_all_lender_ids()
@@ -150,16 +175,8 @@ class TestLoadAllPolicies:
 
     def test_load_all_valid_policies(self, tmp_path):
         """Test loading all valid policies."""
-        for i, name in enumerate(["lender_a", "lender_b"]):
-            policy_data = {
-                "id": name,
-                "name": f"Lender {name}",
-                "version": 1,
-                "programs": [{"id": "p1", "name": "P1"}],
-            }
-            policy_file = tmp_path / f"{name}.yaml"
-            with open(policy_file, "w") as f:
-                yaml.dump(policy_data, f)
+        for name in ("lender_a", "lender_b"):
+            (tmp_path / f"{name}.yaml").write_bytes(_make_policy_yaml(name))
 
         loader = PolicyLoader(tmp_path)
         policies = loader.load_all_policies()
@@ -171,18 +188,10 @@ class TestLoadAllPolicies:
     def test_load_all_skip_errors(self, tmp_path):
         """Test loading all policies with skip_errors=True."""
         # Valid policy
-        valid_data = {
-            "id": "valid_lender",
-            "name": "Valid Lender",
-            "version": 1,
-            "programs": [{"id": "p1", "name": "P1"}],
-        }
-        with open(tmp_path / "valid_lender.yaml", "w") as f:
-            yaml.dump(valid_data, f)
+        (tmp_path / "valid_lender.yaml").write_bytes(_make_policy_yaml("valid_lender"))
 
         # Invalid policy
-        with open(tmp_path / "invalid_lender.yaml", "w") as f:
-            f.write("invalid: yaml: syntax:")
+        (tmp_path / "invalid_lender.yaml").write_bytes(b"invalid: yaml: syntax:")
 
         loader = PolicyLoader(tmp_path)
         policies = loader.load_all_policies(skip_errors=True)
@@ -192,8 +201,7 @@ class TestLoadAllPolicies:
 
     def test_load_all_raise_on_error(self, tmp_path):
         """Test loading all policies raises on first error when skip_errors=False."""
-        with open(tmp_path / "invalid_lender.yaml", "w") as f:
-            f.write("invalid: yaml: syntax:")
+        (tmp_path / "invalid_lender.yaml").write_bytes(b"invalid: yaml: syntax:")
 
         loader = PolicyLoader(tmp_path)
 
@@ -207,18 +215,10 @@ class TestGetActivePolicies:
     def test_get_active_policies(self, tmp_path):
         """Test get_active_policies is alias for load_all_policies with skip_errors."""
         # Valid policy
-        valid_data = {
-            "id": "valid_lender",
-            "name": "Valid Lender",
-            "version": 1,
-            "programs": [{"id": "p1", "name": "P1"}],
-        }
-        with open(tmp_path / "valid_lender.yaml", "w") as f:
-            yaml.dump(valid_data, f)
+        (tmp_path / "valid_lender.yaml").write_bytes(_make_policy_yaml("valid_lender"))
 
         # Invalid policy (should be skipped)
-        with open(tmp_path / "invalid_lender.yaml", "w") as f:
-            f.write("invalid: yaml:")
+        (tmp_path / "invalid_lender.yaml").write_bytes(b"invalid: yaml:")
 
         loader = PolicyLoader(tmp_path)
         policies = loader.get_active_policies()
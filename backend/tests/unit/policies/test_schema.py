@@ -1,7 +1,7 @@
 """Unit tests for policy schema validation."""
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from app.policies.schema import (
     CreditScoreCriteria,
@@ -21,6 +21,17 @@ from app.policies.schema import (
     ScoringConfig,
 )
 
+# Built once so the weight sweeps below validate through a single adapter.
+_SCORING_ADAPTER = TypeAdapter(ScoringConfig)
+
+_SCORING_WEIGHT_FIELDS = (
+    "credit_score_weight",
+    "time_in_business_weight",
+    "loan_amount_weight",
+    "equipment_fit_weight",
+    "credit_history_weight",
+)
+
 
 class TestCreditScoreCriteria:
     """Tests for CreditScoreCriteria validation."""
@@ -86,17 +97,12 @@ class TestBusinessCriteria:
         assert criteria.requires_cdl == "conditional"
         assert criteria.min_cdl_years == 5
 
-    def test_cdl_conditional_value(self):
-        """Test CDL can be conditional."""
-        criteria = BusinessCriteria(requires_cdl="conditional")
-        assert criteria.requires_cdl == "conditional"
-
-    def test_cdl_boolean_value(self):
-        """Test CDL can be boolean."""
-        criteria_true = BusinessCriteria(requires_cdl=True)
-        criteria_false = BusinessCriteria(requires_cdl=False)
-        assert criteria_true.requires_cdl is True
-        assert criteria_false.requires_cdl is False
+    @pytest.mark.parametrize("cdl", ["conditional", True, False])
+    def test_cdl_values(self, cdl):
+        """Test CDL can be conditional or boolean."""
+        criteria = BusinessCriteria(requires_cdl=cdl)
+        assert criteria.requires_cdl == cdl
+        assert type(criteria.requires_cdl) is type(cdl)
 
     def test_negative_tib_raises_error(self):
         """Test negative time in business raises error."""
@@ -388,3 +394,17 @@ class TestScoringConfig:
         assert config.loan_amount_weight == 0.2
         assert config.equipment_fit_weight == 0.15
         assert config.credit_history_weight == 0.15
+
+    def test_every_weight_accepts_bounds(self):
+        """Test each weight accepts the inclusive 0 and 1 bounds."""
+        for field in _SCORING_WEIGHT_FIELDS:
+            for value in (0.0, 1.0):
+                config = _SCORING_ADAPTER.validate_python({field: value})
+                assert getattr(config, field) == value
+
+    def test_every_weight_rejects_out_of_range(self):
+        """Test each weight rejects values outside [0, 1]."""
+        for field in _SCORING_WEIGHT_FIELDS:
+            for value in (-0.1, 1.5):
+                with pytest.raises(ValidationError):
+                    _SCORING_ADAPTER.validate_python({field: value})
@@ -0,0 +1,131 @@
+"""Fixtures for rule engine tests."""
+
+from collections.abc import Callable
+from dataclasses import replace
+from typing import Any
+
+import pytest
+
+from app.rules.base import EvaluationContext
+from app.rules.criteria.business import BusinessRequirementsRule
+from app.rules.criteria.credit_history import CreditHistoryRule
+from app.rules.criteria.credit_score import CreditScoreRule
+from app.rules.criteria.geographic import StateRestrictionRule
+from app.rules.criteria.loan_amount import LoanAmountRule
+from app.rules.registry import RuleRegistry
+
+
+# Rule instances are shared across the session; rules keep no
+# per-evaluation state, so every test can evaluate against the same one.
+
+
+@pytest.fixture(scope="session")
+def business_rule() -> BusinessRequirementsRule:
+    """Shared business requirements rule."""
+    return BusinessRequirementsRule()
+
+
+@pytest.fixture(scope="session")
+def credit_history_rule() -> CreditHistoryRule:
+    """Shared credit history rule."""
+    return CreditHistoryRule()
+
+
+@pytest.fixture(scope="session")
+def credit_score_rule() -> CreditScoreRule:
+    """Shared credit score rule."""
+    return CreditScoreRule()
+
+
+@pytest.fixture(scope="session")
+def state_restriction_rule() -> StateRestrictionRule:
+    """Shared state restriction rule."""
+    return StateRestrictionRule()
+
+
+@pytest.fixture(scope="session")
+def loan_amount_rule() -> LoanAmountRule:
+    """Shared loan amount rule."""
+    return LoanAmountRule()
+
+
+@pytest.fixture(scope="session")
+def assert_contains() -> Callable[[Any, dict[str, tuple[str, ...]]], None]:
+    """Assert each result field contains every expected substring.
+
+    The comparison is case-sensitive, so expectations must use the casing
+    the rule produces.
+    """
+
+    def check(result: Any, expected_in: dict[str, tuple[str, ...]]) -> None:
+        for field, substrings in expected_in.items():
+            value = getattr(result, field)
+            for substring in substrings:
+                assert substring in value, (
+                    f"{substring!r} missing from {field} {value!r}"
+                )
+
+    return check
+
+
+# Canonical contexts shared across the session. EvaluationContext is frozen,
+# so sharing is safe; derive variations with dataclasses.replace.
+
+
+@pytest.fixture(scope="session")
+def make_ctx() -> Callable[..., EvaluationContext]:
+    """Factory returning one shared context per distinct set of field values.
+
+    Field values must be hashable.
+    """
+    cache: dict[tuple[tuple[str, Any], ...], EvaluationContext] = {}
+
+    def _make_ctx(**fields: Any) -> EvaluationContext:
+        key = tuple(sorted(fields.items()))
+        context = cache.get(key)
+        if context is None:
+            context = cache[key] = EvaluationContext(**fields)
+        return context
+
+    return _make_ctx
+
+
+@pytest.fixture(scope="session")
+def ctx_minimal() -> EvaluationContext:
+    """Context with only the application ID set."""
+    return EvaluationContext(application_id="test")
+
+
+@pytest.fixture(scope="session")
+def ctx_fico720(ctx_minimal: EvaluationContext) -> EvaluationContext:
+    """Context with a 720 FICO score."""
+    return replace(ctx_minimal, fico_score=720)
+
+
+@pytest.fixture(scope="session")
+def ctx_trucking(ctx_minimal: EvaluationContext) -> EvaluationContext:
+    """Context for a Class 8 truck application."""
+    return replace(ctx_minimal, equipment_category="class_8_truck")
+
+
+@pytest.fixture(scope="session")
+def ctx_startup(ctx_minimal: EvaluationContext) -> EvaluationContext:
+    """Context for a business under two years old."""
+    return replace(ctx_minimal, years_in_business=1.5)
+
+
+@pytest.fixture
+def isolated_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give the test an empty RuleRegistry of its own.
+
+    The registry stores rules in class-level dicts filled at import time, so
+    tests that clear it or register throwaway rules would otherwise remove
+    the real rules for every later test (e.g. test_matching_engine.py fails
+    with "KeyError: No rule registered with name: credit_score"). Fresh dicts
+    are installed and monkeypatch swaps the originals back afterwards.
+
+    Not autouse: the criteria tests instantiate rules directly and have no
+    need to pay for the swap.
+    """
+    monkeypatch.setattr(RuleRegistry, "_rules", {})
+    monkeypatch.setattr(RuleRegistry, "_instances", {})
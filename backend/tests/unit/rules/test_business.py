@@ -1,231 +1,181 @@
 """Unit tests for business requirements rule."""
 
-import pytest
-
-from app.rules.base import EvaluationContext
-from app.rules.criteria.business import BusinessRequirementsRule
-
-
-class TestTimeInBusinessPasses:
-    """Tests for time in business meeting requirements."""
-
-    def test_time_in_business_meets_minimum(self):
-        """Test TIB exactly at minimum passes."""
-        rule = BusinessRequirementsRule()
-        context = EvaluationContext(application_id="test", years_in_business=2.0)
-        result = rule.evaluate(context, {"min_time_in_business_years": 2})
-
-        assert result.passed is True
-
-    def test_time_in_business_exceeds_minimum(self):
-        """Test TIB above minimum passes."""
-        rule = BusinessRequirementsRule()
-        context = EvaluationContext(application_id="test", years_in_business=5.0)
-        result = rule.evaluate(context, {"min_time_in_business_years": 2})
-
-        assert result.passed is True
-
-
-class TestTimeInBusinessFails:
-    """Tests for time in business failing requirements."""
-
-    def test_time_in_business_below_minimum(self):
-        """Test TIB below minimum fails."""
-        rule = BusinessRequirementsRule()
-        context = EvaluationContext(application_id="test", years_in_business=1.5)
-        result = rule.evaluate(context, {"min_time_in_business_years": 2})
-
-        assert result.passed is False
-        assert "1.5" in result.message
-        assert "below" in result.message.lower()
-
-
-class TestHomeownerRequiredPasses:
-    """Tests for homeowner requirement passing."""
-
-    def test_homeowner_required_and_is_homeowner(self):
-        """Test homeowner requirement when applicant is homeowner."""
-        rule = BusinessRequirementsRule()
-        context = EvaluationContext(application_id="test", is_homeowner=True)
-        result = rule.evaluate(context, {"requires_homeowner": True})
-
-        assert result.passed is True
-
-
-class TestHomeownerRequiredFails:
-    """Tests for homeowner requirement failing."""
-
-    def test_homeowner_required_but_not_homeowner(self):
-        """Test homeowner requirement when applicant is not homeowner."""
-        rule = BusinessRequirementsRule()
-        context = EvaluationContext(application_id="test", is_homeowner=False)
-        result = rule.evaluate(context, {"requires_homeowner": True})
-
-        assert result.passed is False
-        assert "homeowner" in result.message.lower()
-
-
-class TestCDLConditionalTrucking:
-    """Tests for conditional CDL requirement."""
-
-    def test_cdl_conditional_trucking_has_cdl(self):
-        """Test CDL conditional when trucking and has CDL."""
-        rule = BusinessRequirementsRule()
-        context = EvaluationContext(
-            application_id="test",
-            has_cdl=True,
-            equipment_category="class_8_truck",
-        )
-        result = rule.evaluate(context, {"requires_cdl": "conditional"})
-
-        assert result.passed is True
-
-    def test_cdl_conditional_trucking_no_cdl(self):
-        """Test CDL conditional when trucking but no CDL."""
-        rule = BusinessRequirementsRule()
-        context = EvaluationContext(
-            application_id="test",
-            has_cdl=False,
-            equipment_category="class_8_truck",
-        )
-        result = rule.evaluate(context, {"requires_cdl": "conditional"})
-
-        assert result.passed is False
-        assert "cdl" in result.message.lower()
-
+from dataclasses import replace
+from types import MappingProxyType
 
-class TestCDLNotRequiredNonTrucking:
-    """Tests for CDL not required for non-trucking."""
-
-    def test_cdl_conditional_non_trucking(self):
-        """Test CDL conditional for non-trucking equipment."""
-        rule = BusinessRequirementsRule()
-        context = EvaluationContext(
-            application_id="test",
-            has_cdl=False,
-            equipment_category="construction",
-        )
-        result = rule.evaluate(context, {"requires_cdl": "conditional"})
-
-        # Should pass because not trucking
-        assert result.passed is True
-
-
-class TestCDLYearsMinimum:
-    """Tests for CDL years minimum requirement."""
-
-    def test_cdl_years_meets_minimum(self):
-        """Test CDL years meeting minimum."""
-        rule = BusinessRequirementsRule()
-        context = EvaluationContext(
-            application_id="test",
-            has_cdl=True,
-            cdl_years=5,
-        )
-        result = rule.evaluate(context, {"min_cdl_years": 5})
-
-        assert result.passed is True
-
-    def test_cdl_years_below_minimum(self):
-        """Test CDL years below minimum."""
-        rule = BusinessRequirementsRule()
-        context = EvaluationContext(
-            application_id="test",
-            has_cdl=True,
-            cdl_years=2,
-        )
-        result = rule.evaluate(context, {"min_cdl_years": 5})
-
-        assert result.passed is False
-
-
-class TestIndustryExperienceMinimum:
-    """Tests for industry experience minimum."""
-
-    def test_industry_experience_meets_minimum(self):
-        """Test industry experience meeting minimum."""
-        rule = BusinessRequirementsRule()
-        context = EvaluationContext(
-            application_id="test",
-            industry_experience_years=10,
-        )
-        result = rule.evaluate(context, {"min_industry_experience_years": 5})
-
-        assert result.passed is True
-
-    def test_industry_experience_below_minimum(self):
-        """Test industry experience below minimum."""
-        rule = BusinessRequirementsRule()
-        context = EvaluationContext(
-            application_id="test",
-            industry_experience_years=3,
-        )
-        result = rule.evaluate(context, {"min_industry_experience_years": 5})
-
-        assert result.passed is False
-
-
-class TestFleetSizeMinimum:
-    """Tests for fleet size minimum."""
-
-    def test_fleet_size_meets_minimum(self):
-        """Test fleet size meeting minimum."""
-        rule = BusinessRequirementsRule()
-        context = EvaluationContext(application_id="test", fleet_size=5)
-        result = rule.evaluate(context, {"min_fleet_size": 3})
-
-        assert result.passed is True
-
-    def test_fleet_size_below_minimum(self):
-        """Test fleet size below minimum."""
-        rule = BusinessRequirementsRule()
-        context = EvaluationContext(application_id="test", fleet_size=1)
-        result = rule.evaluate(context, {"min_fleet_size": 3})
-
-        assert result.passed is False
-
-
-class TestMultipleRequirementsAllMustPass:
-    """Tests for multiple requirements all needing to pass."""
-
-    def test_all_requirements_pass(self):
-        """Test when all requirements pass."""
-        rule = BusinessRequirementsRule()
-        context = EvaluationContext(
-            application_id="test",
-            years_in_business=5.0,
-            is_homeowner=True,
-            has_cdl=True,
-        )
-        result = rule.evaluate(
-            context,
-            {
-                "min_time_in_business_years": 2,
-                "requires_homeowner": True,
-                "requires_cdl": True,
-            },
-        )
-
-        assert result.passed is True
-
-    def test_one_requirement_fails(self):
-        """Test when one requirement fails."""
-        rule = BusinessRequirementsRule()
-        context = EvaluationContext(
-            application_id="test",
-            years_in_business=5.0,
-            is_homeowner=False,  # This will fail
-            has_cdl=True,
-        )
-        result = rule.evaluate(
-            context,
-            {
-                "min_time_in_business_years": 2,
-                "requires_homeowner": True,
-                "requires_cdl": True,
-            },
-        )
+import pytest
 
-        assert result.passed is False
-        assert result.details is not None
-        assert "failed_checks" in result.details
+# Criteria are read-only inputs, so each distinct one is built once and
+# frozen so no test can change it for the others.
+CRIT_TIB_2 = MappingProxyType({"min_time_in_business_years": 2})
+CRIT_HOMEOWNER = MappingProxyType({"requires_homeowner": True})
+CRIT_CDL_CONDITIONAL = MappingProxyType({"requires_cdl": "conditional"})
+CRIT_CDL_YEARS_5 = MappingProxyType({"min_cdl_years": 5})
+CRIT_INDUSTRY_EXPERIENCE_5 = MappingProxyType(
+    {"min_industry_experience_years": 5}
+)
+CRIT_FLEET_SIZE_3 = MappingProxyType({"min_fleet_size": 3})
+CRIT_TIB_HOMEOWNER_CDL = MappingProxyType(
+    {
+        "min_time_in_business_years": 2,
+        "requires_homeowner": True,
+        "requires_cdl": True,
+    }
+)
+CRIT_TIB_HOMEOWNER = MappingProxyType(
+    {"min_time_in_business_years": 2, "requires_homeowner": True}
+)
+
+# (context kwargs, criteria, expected passed, expected lowercase message substring)
+CASES = [
+    # Time in business
+    pytest.param(
+        {"years_in_business": 2.0},
+        CRIT_TIB_2,
+        True,
+        None,
+        id="tib_meets_minimum",
+    ),
+    pytest.param(
+        {"years_in_business": 5.0},
+        CRIT_TIB_2,
+        True,
+        None,
+        id="tib_exceeds_minimum",
+    ),
+    pytest.param(
+        {"years_in_business": 1.5},
+        CRIT_TIB_2,
+        False,
+        "1.5 years below",
+        id="tib_below_minimum",
+    ),
+    # Homeowner
+    pytest.param(
+        {"is_homeowner": True},
+        CRIT_HOMEOWNER,
+        True,
+        None,
+        id="homeowner_required_is_homeowner",
+    ),
+    pytest.param(
+        {"is_homeowner": False},
+        CRIT_HOMEOWNER,
+        False,
+        "homeowner",
+        id="homeowner_required_not_homeowner",
+    ),
+    # Conditional CDL
+    pytest.param(
+        {"has_cdl": True, "equipment_category": "class_8_truck"},
+        CRIT_CDL_CONDITIONAL,
+        True,
+        None,
+        id="cdl_conditional_trucking_has_cdl",
+    ),
+    pytest.param(
+        {"has_cdl": False, "equipment_category": "class_8_truck"},
+        CRIT_CDL_CONDITIONAL,
+        False,
+        "cdl",
+        id="cdl_conditional_trucking_no_cdl",
+    ),
+    pytest.param(
+        {"has_cdl": False, "equipment_category": "construction"},
+        CRIT_CDL_CONDITIONAL,
+        True,  # Not trucking, so CDL is not required
+        None,
+        id="cdl_conditional_non_trucking",
+    ),
+    # CDL years
+    pytest.param(
+        {"has_cdl": True, "cdl_years": 5},
+        CRIT_CDL_YEARS_5,
+        True,
+        None,
+        id="cdl_years_meets_minimum",
+    ),
+    pytest.param(
+        {"has_cdl": True, "cdl_years": 2},
+        CRIT_CDL_YEARS_5,
+        False,
+        None,
+        id="cdl_years_below_minimum",
+    ),
+    # Industry experience
+    pytest.param(
+        {"industry_experience_years": 10},
+        CRIT_INDUSTRY_EXPERIENCE_5,
+        True,
+        None,
+        id="industry_experience_meets_minimum",
+    ),
+    pytest.param(
+        {"industry_experience_years": 3},
+        CRIT_INDUSTRY_EXPERIENCE_5,
+        False,
+        None,
+        id="industry_experience_below_minimum",
+    ),
+    # Fleet size
+    pytest.param(
+        {"fleet_size": 5},
+        CRIT_FLEET_SIZE_3,
+        True,
+        None,
+        id="fleet_size_meets_minimum",
+    ),
+    pytest.param(
+        {"fleet_size": 1},
+        CRIT_FLEET_SIZE_3,
+        False,
+        None,
+        id="fleet_size_below_minimum",
+    ),
+    # Multiple requirements must all pass
+    pytest.param(
+        {"years_in_business": 5.0, "is_homeowner": True, "has_cdl": True},
+        CRIT_TIB_HOMEOWNER_CDL,
+        True,
+        None,
+        id="all_requirements_pass",
+    ),
+]
+
+
+@pytest.mark.parametrize("context_kwargs,criteria,passed,substring", CASES)
+def test_business_requirement(
+    business_rule, make_ctx, context_kwargs, criteria, passed, substring
+):
+    """Test a single business requirement against the rule."""
+    context = make_ctx(application_id="test", **context_kwargs)
+    result = business_rule.evaluate(context, criteria)
+
+    assert result.passed is passed
+    if substring is not None:
+        assert substring in result.message.lower()
+
+
+def test_one_requirement_fails(business_rule, ctx_minimal):
+    """Test when one of several requirements fails."""
+    context = replace(
+        ctx_minimal,
+        years_in_business=5.0,
+        is_homeowner=False,  # This will fail
+        has_cdl=True,
+    )
+    result = business_rule.evaluate(context, CRIT_TIB_HOMEOWNER_CDL)
+
+    assert result.passed is False
+    assert result.details is not None
+    assert "failed_checks" in result.details
+
+
+def test_reports_every_failed_check(business_rule, ctx_minimal):
+    """Test all failing checks are reported, led by the first failure."""
+    context = replace(ctx_minimal, years_in_business=1.0, is_homeowner=False)
+    result = business_rule.evaluate(context, CRIT_TIB_HOMEOWNER)
+
+    assert result.passed is False
+    assert len(result.details["failed_checks"]) == 2
+    assert result.message == result.details["failed_checks"][0]["message"]
@@ -1,141 +1,130 @@
 """Unit tests for credit score rules."""
 
-import pytest
-
-from app.rules.base import EvaluationContext
-from app.rules.criteria.credit_score import CreditScoreRule
-
-
-class TestFicoScorePassesWhenMeetsMinimum:
-    """Tests for FICO score meeting minimum."""
-
-    def test_fico_meets_minimum(self):
-        """Test FICO score exactly at minimum passes."""
-        rule = CreditScoreRule()
-        context = EvaluationContext(application_id="test", fico_score=700)
-        result = rule.evaluate(context, {"type": "fico", "min": 700})
-
-        assert result.passed is True
-        assert "700" in result.message
-        assert result.score >= 70
-
-    def test_fico_exceeds_minimum(self):
-        """Test FICO score above minimum passes with bonus."""
-        rule = CreditScoreRule()
-        context = EvaluationContext(application_id="test", fico_score=750)
-        result = rule.evaluate(context, {"type": "fico", "min": 700})
-
-        assert result.passed is True
-        assert result.score > 70  # Should have bonus for exceeding
-
-
-class TestFicoScoreFailsWhenBelowMinimum:
-    """Tests for FICO score below minimum."""
-
-    def test_fico_below_minimum(self):
-        """Test FICO score below minimum fails."""
-        rule = CreditScoreRule()
-        context = EvaluationContext(application_id="test", fico_score=650)
-        result = rule.evaluate(context, {"type": "fico", "min": 700})
-
-        assert result.passed is False
-        assert "650" in result.message
-        assert "below" in result.message.lower()
-        assert result.score == 0
-
-
-class TestFicoScoreNotProvided:
-    """Tests for missing FICO score."""
-
-    def test_fico_not_provided(self):
-        """Test missing FICO score fails."""
-        rule = CreditScoreRule()
-        context = EvaluationContext(application_id="test")  # No fico_score
-        result = rule.evaluate(context, {"type": "fico", "min": 700})
-
-        assert result.passed is False
-        assert "not provided" in result.message.lower()
-        assert result.score == 0
-
-
-class TestFicoScoreBonusCalculation:
-    """Tests for FICO score bonus calculation."""
-
-    def test_bonus_for_high_score(self):
-        """Test bonus for significantly exceeding minimum."""
-        rule = CreditScoreRule()
-        context = EvaluationContext(application_id="test", fico_score=800)
-        result = rule.evaluate(context, {"type": "fico", "min": 700})
+from types import MappingProxyType
 
-        assert result.passed is True
-        # Excess is 100, bonus should be 30 (capped)
-        assert result.score == 100  # 70 base + 30 bonus
-
-    def test_small_bonus_for_slight_excess(self):
-        """Test small bonus for slightly exceeding minimum."""
-        rule = CreditScoreRule()
-        context = EvaluationContext(application_id="test", fico_score=710)
-        result = rule.evaluate(context, {"type": "fico", "min": 700})
-
-        assert result.passed is True
-        # Excess is 10, bonus should be 3
-        assert 70 < result.score < 80
-
-
-class TestTransUnionScoreEvaluation:
-    """Tests for TransUnion score evaluation."""
-
-    def test_transunion_meets_minimum(self):
-        """Test TransUnion score meeting minimum."""
-        rule = CreditScoreRule()
-        context = EvaluationContext(application_id="test", transunion_score=720)
-        result = rule.evaluate(context, {"type": "transunion", "min": 700})
-
-        assert result.passed is True
-        assert "transunion" in result.rule_name.lower()
-
-    def test_transunion_below_minimum(self):
-        """Test TransUnion score below minimum."""
-        rule = CreditScoreRule()
-        context = EvaluationContext(application_id="test", transunion_score=680)
-        result = rule.evaluate(context, {"type": "transunion", "min": 700})
-
-        assert result.passed is False
-
-
-class TestPayNetScoreEvaluation:
-    """Tests for PayNet (business) score evaluation."""
-
-    def test_paynet_meets_minimum(self):
-        """Test PayNet score meeting minimum."""
-        rule = CreditScoreRule()
-        context = EvaluationContext(application_id="test", paynet_score=85)
-        result = rule.evaluate(context, {"type": "paynet", "min": 75})
-
-        assert result.passed is True
-
-    def test_paynet_below_minimum(self):
-        """Test PayNet score below minimum."""
-        rule = CreditScoreRule()
-        context = EvaluationContext(application_id="test", paynet_score=65)
-        result = rule.evaluate(context, {"type": "paynet", "min": 75})
-
-        assert result.passed is False
-
-
-class TestScoreTypeSelection:
-    """Tests for score type selection."""
-
-    def test_defaults_to_fico(self):
-        """Test that default score type is FICO."""
-        rule = CreditScoreRule()
-        context = EvaluationContext(
-            application_id="test",
-            fico_score=720,
-            transunion_score=700,  # Lower but shouldn't be used
-        )
-        result = rule.evaluate(context, {"min": 710})  # No type specified
+import pytest
 
-        assert result.passed is True
-        assert "fico" in result.rule_name.lower()
 
+CRIT_FICO_700 = MappingProxyType({"type": "fico", "min": 700})
+
+# (context kwargs, criteria, expected passed, inclusive score range or None,
+#  {result field: substrings expected in it, compared case-sensitively})
+CASES = [
+    # FICO
+    pytest.param(
+        {"fico_score": 700},
+        CRIT_FICO_700,
+        True,
+        (70, 100),
+        {"message": ("700",)},
+        id="fico_at_min",
+    ),
+    pytest.param(
+        {"fico_score": 750},
+        CRIT_FICO_700,
+        True,
+        (71, 100),  # Bonus for exceeding the minimum
+        {},
+        id="fico_above_min",
+    ),
+    pytest.param(
+        {"fico_score": 650},
+        CRIT_FICO_700,
+        False,
+        (0, 0),
+        {"message": ("650", "below")},
+        id="fico_below_min",
+    ),
+    pytest.param(
+        {},
+        CRIT_FICO_700,
+        False,
+        (0, 0),
+        {"message": ("not provided",)},
+        id="fico_not_provided",
+    ),
+    # TransUnion
+    pytest.param(
+        {"transunion_score": 720},
+        {"type": "transunion", "min": 700},
+        True,
+        None,
+        {"rule_name": ("Transunion",)},
+        id="transunion_meets_min",
+    ),
+    pytest.param(
+        {"transunion_score": 680},
+        {"type": "transunion", "min": 700},
+        False,
+        None,
+        {},
+        id="transunion_below_min",
+    ),
+    # PayNet (business)
+    pytest.param(
+        {"paynet_score": 85},
+        {"type": "paynet", "min": 75},
+        True,
+        None,
+        {},
+        id="paynet_meets_min",
+    ),
+    pytest.param(
+        {"paynet_score": 65},
+        {"type": "paynet", "min": 75},
+        False,
+        None,
+        {},
+        id="paynet_below_min",
+    ),
+    # Score type selection: the lower TransUnion score must not be used
+    pytest.param(
+        {"fico_score": 720, "transunion_score": 700},
+        {"min": 710},
+        True,
+        None,
+        {"rule_name": ("Fico",)},
+        id="defaults_to_fico",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "context_kwargs,criteria,passed,score_range,expected_in", CASES
+)
+def test_credit_score(
+    credit_score_rule,
+    make_ctx,
+    assert_contains,
+    context_kwargs,
+    criteria,
+    passed,
+    score_range,
+    expected_in,
+):
+    """Test a credit score requirement against the rule."""
+    context = make_ctx(application_id="test", **context_kwargs)
+    result = credit_score_rule.evaluate(context, criteria)
+
+    assert result.passed is passed
+    if score_range is not None:
+        low, high = score_range
+        assert low <= result.score <= high
+    assert_contains(result, expected_in)
+
+
+# FICO score -> expected score for a 700 minimum: 70 base plus 0.3 points
+# per point of excess, capped at 30 bonus points.
+FICO_BONUS_TABLE = [(700, 70), (710, 73), (750, 85), (800, 100), (900, 100)]
+
+
+def test_fico_bonus_table(credit_score_rule, make_ctx):
+    """Test the FICO bonus formula across a table of scores."""
+    actual = [
+        credit_score_rule.evaluate(
+            make_ctx(application_id="test", fico_score=fico), CRIT_FICO_700
+        ).score
+        for fico, _ in FICO_BONUS_TABLE
+    ]
+
+    assert actual == pytest.approx([expected for _, expected in FICO_BONUS_TABLE])
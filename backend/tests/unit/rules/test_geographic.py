@@ -1,90 +1,68 @@
 """Unit tests for geographic restriction rules."""
 
-import pytest
-
-from app.rules.base import EvaluationContext
-from app.rules.criteria.geographic import StateRestrictionRule
-
-
-class TestStateAllowed:
-    """Tests for allowed states."""
-
-    def test_state_not_in_exclusion_list(self):
-        """Test state not in exclusion list passes."""
-        rule = StateRestrictionRule()
-        context = EvaluationContext(application_id="test", state="TX")
-        result = rule.evaluate(context, {"excluded_states": ["CA", "NY"]})
-
-        assert result.passed is True
-        assert "TX" in result.actual_value
-
-    def test_state_in_allowed_list(self):
-        """Test state in allowed list passes."""
-        rule = StateRestrictionRule()
-        context = EvaluationContext(application_id="test", state="TX")
-        result = rule.evaluate(context, {"allowed_states": ["TX", "OK", "LA"]})
-
-        assert result.passed is True
-
-
-class TestStateExcluded:
-    """Tests for excluded states."""
-
-    def test_state_in_exclusion_list(self):
-        """Test state in exclusion list fails."""
-        rule = StateRestrictionRule()
-        context = EvaluationContext(application_id="test", state="CA")
-        result = rule.evaluate(context, {"excluded_states": ["CA", "NY"]})
-
-        assert result.passed is False
-        assert "CA" in result.message
-        assert "excluded" in result.message.lower()
+from types import MappingProxyType
 
-    def test_state_not_in_allowed_list(self):
-        """Test state not in allowed list fails."""
-        rule = StateRestrictionRule()
-        context = EvaluationContext(application_id="test", state="FL")
-        result = rule.evaluate(context, {"allowed_states": ["TX", "OK", "LA"]})
-
-        assert result.passed is False
-        assert "FL" in result.actual_value
-
-
-class TestEmptyExclusionList:
-    """Tests for empty exclusion list."""
-
-    def test_empty_exclusion_list_allows_all(self):
-        """Test empty exclusion list allows all states."""
-        rule = StateRestrictionRule()
-        context = EvaluationContext(application_id="test", state="CA")
-        result = rule.evaluate(context, {"excluded_states": []})
-
-        assert result.passed is True
-
-    def test_no_exclusion_criteria_allows_all(self):
-        """Test no exclusion criteria allows all states."""
-        rule = StateRestrictionRule()
-        context = EvaluationContext(application_id="test", state="NY")
-        result = rule.evaluate(context, {})
-
-        assert result.passed is True
-
-
-class TestCaseInsensitiveState:
-    """Tests for case insensitive state matching."""
-
-    def test_lowercase_state_in_context(self):
-        """Test lowercase state in context is normalized."""
-        rule = StateRestrictionRule()
-        context = EvaluationContext(application_id="test", state="ca")
-        result = rule.evaluate(context, {"excluded_states": ["CA", "NY"]})
-
-        assert result.passed is False
+import pytest
 
-    def test_mixed_case_in_exclusion_list(self):
-        """Test mixed case in exclusion list works."""
-        rule = StateRestrictionRule()
-        context = EvaluationContext(application_id="test", state="CA")
-        result = rule.evaluate(context, {"excluded_states": ["ca", "ny"]})
 
-        assert result.passed is False
+CRIT_EXCLUDE_CA_NY = MappingProxyType({"excluded_states": ["CA", "NY"]})
+CRIT_ALLOW_TX_OK_LA = MappingProxyType({"allowed_states": ["TX", "OK", "LA"]})
+
+# (state, criteria, expected passed,
+#  {result field: substrings expected in it, compared case-sensitively})
+CASES = [
+    # Allowed states
+    pytest.param(
+        "TX",
+        CRIT_EXCLUDE_CA_NY,
+        True,
+        {"actual_value": ("TX",)},
+        id="not_in_exclusion_list",
+    ),
+    pytest.param("TX", CRIT_ALLOW_TX_OK_LA, True, {}, id="in_allowed_list"),
+    # Excluded states
+    pytest.param(
+        "CA",
+        CRIT_EXCLUDE_CA_NY,
+        False,
+        {"message": ("CA", "excluded")},
+        id="in_exclusion_list",
+    ),
+    pytest.param(
+        "FL",
+        CRIT_ALLOW_TX_OK_LA,
+        False,
+        {"actual_value": ("FL",)},
+        id="not_in_allowed_list",
+    ),
+    # Empty or missing exclusion list allows all states
+    pytest.param("CA", {"excluded_states": []}, True, {}, id="empty_exclusion_list"),
+    pytest.param("NY", {}, True, {}, id="no_exclusion_criteria"),
+    # Case-insensitive matching
+    pytest.param("ca", CRIT_EXCLUDE_CA_NY, False, {}, id="lowercase_context_state"),
+    pytest.param(
+        "CA",
+        {"excluded_states": ["ca", "ny"]},
+        False,
+        {},
+        id="lowercase_exclusion_list",
+    ),
+]
+
+
+@pytest.mark.parametrize("state,criteria,passed,expected_in", CASES)
+def test_state_restriction(
+    state_restriction_rule,
+    make_ctx,
+    assert_contains,
+    state,
+    criteria,
+    passed,
+    expected_in,
+):
+    """Test a state restriction against the rule."""
+    context = make_ctx(application_id="test", state=state)
+    result = state_restriction_rule.evaluate(context, criteria)
+
+    assert result.passed is passed
+    assert_contains(result, expected_in)
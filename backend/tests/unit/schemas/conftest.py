@@ -0,0 +1,82 @@
+"""Fixtures for schema tests.
+
+The valid instances are validated once per module and shared. Tests must
+not mutate them; build variations from ``valid_app_kwargs`` instead.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from app.schemas import (
+    BusinessCreate,
+    EquipmentInput,
+    GuarantorCreate,
+    LoanApplicationInput,
+)
+
+
+@pytest.fixture(scope="module")
+def valid_business() -> BusinessCreate:
+    """A valid trucking business."""
+    return BusinessCreate(
+        legal_name="Test Trucking LLC",
+        entity_type="LLC",
+        industry_code="484121",
+        industry_name="Trucking",
+        state="TX",
+        city="Houston",
+        zip_code="77001",
+        years_in_business=Decimal("5.0"),
+    )
+
+
+@pytest.fixture(scope="module")
+def valid_guarantor() -> GuarantorCreate:
+    """A valid homeowner guarantor with a 720 FICO score."""
+    return GuarantorCreate(
+        first_name="John",
+        last_name="Doe",
+        fico_score=720,
+        is_homeowner=True,
+    )
+
+
+@pytest.fixture(scope="module")
+def base_guarantor_kwargs() -> dict[str, Any]:
+    """Minimal keyword arguments for a valid GuarantorCreate."""
+    return {"first_name": "Test", "last_name": "User"}
+
+
+@pytest.fixture(scope="module")
+def valid_equipment() -> EquipmentInput:
+    """A valid used Class 8 truck."""
+    return EquipmentInput(
+        category="class_8_truck",
+        type="Sleeper Cab",
+        year=2022,
+        condition="used",
+    )
+
+
+@pytest.fixture(scope="module")
+def valid_app_kwargs(
+    valid_business: BusinessCreate,
+    valid_guarantor: GuarantorCreate,
+    valid_equipment: EquipmentInput,
+) -> dict[str, Any]:
+    """Keyword arguments for a valid LoanApplicationInput."""
+    return {
+        "business": valid_business,
+        "guarantor": valid_guarantor,
+        "loan_amount": 10000000,
+        "transaction_type": "purchase",
+        "equipment": valid_equipment,
+    }
+
+
+@pytest.fixture(scope="module")
+def valid_app_json(valid_app_kwargs: dict[str, Any]) -> bytes:
+    """The valid application serialized once as a JSON request body."""
+    return LoanApplicationInput(**valid_app_kwargs).model_dump_json().encode()
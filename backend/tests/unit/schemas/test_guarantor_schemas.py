@@ -1,59 +1,67 @@
 """Unit tests for guarantor schemas."""
 
-from datetime import date, timedelta
+from datetime import date
+from typing import Annotated, Any
 
 import pytest
-from pydantic import ValidationError
+from pydantic import AfterValidator, TypeAdapter, ValidationError
 
 from app.schemas import GuarantorCreate
 
 
+def _field_adapter(name: str, base_type: type, *validators: Any) -> TypeAdapter:
+    """Build an adapter for one GuarantorCreate field's own constraints.
+
+    Field-level tests validate through these instead of the whole model, so
+    they only run the validator under test. The constraints are read from the
+    schema so the adapters cannot drift from it.
+    """
+    metadata = GuarantorCreate.model_fields[name].metadata
+    return TypeAdapter(Annotated[base_type, *metadata, *validators])
+
+
+# Whole-model adapter for the parametrized tests, which pass plain dicts.
+_GUARANTOR_TA = TypeAdapter(GuarantorCreate)
+_FICO_ADAPTER = _field_adapter("fico_score", int)
+
+# Fixed discharge date so bankruptcy cases are deterministic.
+_BK_DATE = date(2021, 1, 1)
+
+_SSN_ADAPTER = _field_adapter(
+    "ssn_last_four", str, AfterValidator(GuarantorCreate.validate_ssn)
+)
+
+
 class TestCreditScoreBounds:
     """Tests for credit score range validation."""
 
-    def test_fico_score_at_minimum(self):
-        """Test FICO score at minimum (300)."""
-        guarantor = GuarantorCreate(
-            first_name="Test",
-            last_name="User",
-            fico_score=300,
-        )
-        assert guarantor.fico_score == 300
+    @pytest.mark.parametrize("score", [300, 850], ids=["minimum", "maximum"])
+    def test_fico_score_in_range(self, score):
+        """Test FICO scores at the bounds (300-850) are accepted."""
+        assert _FICO_ADAPTER.validate_python(score) == score
 
-    def test_fico_score_at_maximum(self):
-        """Test FICO score at maximum (850)."""
-        guarantor = GuarantorCreate(
-            first_name="Test",
-            last_name="User",
-            fico_score=850,
-        )
-        assert guarantor.fico_score == 850
+    @pytest.mark.parametrize(
+        "score", [299, 851], ids=["below_minimum", "above_maximum"]
+    )
+    def test_fico_score_out_of_range_raises(self, score):
+        """Test FICO scores outside 300-850 raise ValidationError."""
+        with pytest.raises(ValidationError):
+            _FICO_ADAPTER.validate_python(score)
 
-    def test_fico_score_below_minimum_raises(self):
-        """Test FICO score below minimum raises ValidationError."""
+    def test_fico_score_error_names_field(self, base_guarantor_kwargs):
+        """Test an out-of-range FICO score is reported against fico_score."""
         with pytest.raises(ValidationError) as exc_info:
             GuarantorCreate(
-                first_name="Test",
-                last_name="User",
+                **base_guarantor_kwargs,
                 fico_score=299,
             )
-        assert "fico_score" in str(exc_info.value).lower()
-
-    def test_fico_score_above_maximum_raises(self):
-        """Test FICO score above maximum raises ValidationError."""
-        with pytest.raises(ValidationError) as exc_info:
-            GuarantorCreate(
-                first_name="Test",
-                last_name="User",
-                fico_score=851,
-            )
-        assert "fico_score" in str(exc_info.value).lower()
+        errors = exc_info.value.errors(include_url=False, include_context=False)
+        assert any(error["loc"] == ("fico_score",) for error in errors)
 
-    def test_all_credit_scores_valid_range(self):
+    def test_all_credit_scores_valid_range(self, base_guarantor_kwargs):
         """Test all credit scores accept valid range."""
         guarantor = GuarantorCreate(
-            first_name="Test",
-            last_name="User",
+            **base_guarantor_kwargs,
             fico_score=720,
             transunion_score=715,
             experian_score=725,
@@ -68,64 +76,69 @@ class TestCreditScoreBounds:
 class TestBankruptcyConditionalFields:
     """Tests for bankruptcy conditional field validation."""
 
-    def test_bankruptcy_with_all_fields(self):
+    def test_bankruptcy_with_all_fields(self, base_guarantor_kwargs):
         """Test bankruptcy with all related fields."""
-        discharge_date = date.today() - timedelta(days=365 * 3)
         guarantor = GuarantorCreate(
-            first_name="Test",
-            last_name="User",
+            **base_guarantor_kwargs,
             has_bankruptcy=True,
-            bankruptcy_discharge_date=discharge_date,
+            bankruptcy_discharge_date=_BK_DATE,
             bankruptcy_chapter="7",
         )
         assert guarantor.has_bankruptcy is True
-        assert guarantor.bankruptcy_discharge_date == discharge_date
+        assert guarantor.bankruptcy_discharge_date == _BK_DATE
         assert guarantor.bankruptcy_chapter == "7"
 
-    def test_no_bankruptcy_clears_related_fields(self):
+    def test_no_bankruptcy_clears_related_fields(self, base_guarantor_kwargs):
         """Test that no bankruptcy clears related fields."""
         guarantor = GuarantorCreate(
-            first_name="Test",
-            last_name="User",
+            **base_guarantor_kwargs,
             has_bankruptcy=False,
-            bankruptcy_discharge_date=date.today(),  # Should be cleared
+            bankruptcy_discharge_date=_BK_DATE,  # Should be cleared
             bankruptcy_chapter="7",  # Should be cleared
         )
         assert guarantor.has_bankruptcy is False
         assert guarantor.bankruptcy_discharge_date is None
         assert guarantor.bankruptcy_chapter is None
 
-    def test_valid_bankruptcy_chapters(self):
-        """Test valid bankruptcy chapters."""
-        for chapter in ["7", "11", "13"]:
-            guarantor = GuarantorCreate(
-                first_name="Test",
-                last_name="User",
+    @pytest.mark.parametrize("chapter", ["7", "11", "13"])
+    def test_valid_bankruptcy_chapter(self, chapter, base_guarantor_kwargs):
+        """Test each supported bankruptcy chapter is accepted."""
+        guarantor = _GUARANTOR_TA.validate_python(
+            {
+                **base_guarantor_kwargs,
+                "has_bankruptcy": True,
+                "bankruptcy_chapter": chapter,
+            }
+        )
+        assert guarantor.bankruptcy_chapter == chapter
+
+    def test_invalid_bankruptcy_chapter_raises(self, base_guarantor_kwargs):
+        """Test an unsupported bankruptcy chapter raises ValidationError."""
+        with pytest.raises(ValidationError):
+            GuarantorCreate(
+                **base_guarantor_kwargs,
                 has_bankruptcy=True,
-                bankruptcy_chapter=chapter,
+                bankruptcy_chapter="9",
             )
-            assert guarantor.bankruptcy_chapter == chapter
 
 
 class TestJudgementConditionalFields:
     """Tests for judgement conditional field validation."""
 
-    def test_judgement_with_amount(self):
+    def test_judgement_with_amount(self, base_guarantor_kwargs):
         """Test judgement with amount."""
         guarantor = GuarantorCreate(
-            first_name="Test",
-            last_name="User",
+            **base_guarantor_kwargs,
             has_open_judgements=True,
             judgement_amount=5000,
         )
         assert guarantor.has_open_judgements is True
         assert guarantor.judgement_amount == 5000
 
-    def test_no_judgement_clears_amount(self):
+    def test_no_judgement_clears_amount(self, base_guarantor_kwargs):
         """Test that no judgement clears amount."""
         guarantor = GuarantorCreate(
-            first_name="Test",
-            last_name="User",
+            **base_guarantor_kwargs,
             has_open_judgements=False,
             judgement_amount=5000,  # Should be cleared
         )
@@ -136,22 +149,20 @@ class TestJudgementConditionalFields:
 class TestTaxLienConditionalFields:
     """Tests for tax lien conditional field validation."""
 
-    def test_tax_lien_with_amount(self):
+    def test_tax_lien_with_amount(self, base_guarantor_kwargs):
         """Test tax lien with amount."""
         guarantor = GuarantorCreate(
-            first_name="Test",
-            last_name="User",
+            **base_guarantor_kwargs,
             has_tax_liens=True,
             tax_lien_amount=10000,
         )
         assert guarantor.has_tax_liens is True
         assert guarantor.tax_lien_amount == 10000
 
-    def test_no_tax_lien_clears_amount(self):
+    def test_no_tax_lien_clears_amount(self, base_guarantor_kwargs):
         """Test that no tax lien clears amount."""
         guarantor = GuarantorCreate(
-            first_name="Test",
-            last_name="User",
+            **base_guarantor_kwargs,
             has_tax_liens=False,
             tax_lien_amount=10000,  # Should be cleared
         )
@@ -162,38 +173,25 @@ class TestTaxLienConditionalFields:
 class TestSSNValidation:
     """Tests for SSN last four validation."""
 
-    def test_valid_ssn_last_four(self):
-        """Test valid SSN last four digits."""
+    @pytest.mark.parametrize("ssn", ["1234", "0000"])
+    def test_valid_ssn_last_four(self, ssn):
+        """Test well-formed SSN last four digits are accepted unchanged."""
+        assert _SSN_ADAPTER.validate_python(ssn) == ssn
+
+    @pytest.mark.parametrize(
+        "ssn",
+        ["123", "12345", "12ab"],
+        ids=["too_short", "too_long", "non_numeric"],
+    )
+    def test_invalid_ssn_raises(self, ssn):
+        """Test malformed SSN last four raises ValidationError."""
+        with pytest.raises(ValidationError):
+            _SSN_ADAPTER.validate_python(ssn)
+
+    def test_ssn_set_on_guarantor(self, base_guarantor_kwargs):
+        """Test a valid SSN is stored on the guarantor."""
         guarantor = GuarantorCreate(
-            first_name="Test",
-            last_name="User",
+            **base_guarantor_kwargs,
             ssn_last_four="1234",
         )
         assert guarantor.ssn_last_four == "1234"
-
-    def test_ssn_too_short_raises(self):
-        """Test SSN too short raises ValidationError."""
-        with pytest.raises(ValidationError):
-            GuarantorCreate(
-                first_name="Test",
-                last_name="User",
-                ssn_last_four="123",
-            )
-
-    def test_ssn_too_long_raises(self):
-        """Test SSN too long raises ValidationError."""
-        with pytest.raises(ValidationError):
-            GuarantorCreate(
-                first_name="Test",
-                last_name="User",
-                ssn_last_four="12345",
-            )
-
-    def test_ssn_non_numeric_raises(self):
-        """Test SSN with non-numeric characters raises ValidationError."""
-        with pytest.raises(ValidationError):
-            GuarantorCreate(
-                first_name="Test",
-                last_name="User",
-                ssn_last_four="12ab",
-            )
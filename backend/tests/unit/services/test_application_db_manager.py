@@ -1,11 +1,15 @@
 """Unit tests for ApplicationDBManager (database persistence layer)."""
 
-from uuid import UUID
+from collections import Counter
+from collections.abc import Awaitable, Callable, Generator
+from uuid import UUID, uuid4
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam, event, insert, lambda_stmt, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine.default import CACHE_HIT
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from app.models.application import LoanApplication
 from app.models.business import Business
@@ -14,109 +18,216 @@ from app.models.guarantor import PersonalGuarantor
 from app.models.lender import Lender
 from app.models.match_result import MatchResult
 from app.policies.schema import LenderPolicy, LenderProgram
-from app.schemas.api import (
-    ApplicantInput,
-    ApplicationSubmitRequest,
-    BusinessCreditInput,
-    BusinessInput,
-    CreditHistoryInput,
-    EquipmentInput,
-    LoanRequestInput,
-)
+from app.schemas.api import ApplicationSubmitRequest, BusinessCreditInput
 from app.services.application_db_manager import ApplicationDBManager
 
 
-@pytest.fixture
+# Assertion queries, built once. lambda_stmt caches on the lambda's code
+# object, so re-executing them skips rebuilding the select each time.
+_SEL_BUSINESS = lambda_stmt(
+    lambda: select(Business).where(Business.id == bindparam("bid"))
+)
+_SEL_GUARANTOR = lambda_stmt(
+    lambda: select(PersonalGuarantor).where(PersonalGuarantor.id == bindparam("gid"))
+)
+_SEL_BUSINESS_CREDIT = lambda_stmt(
+    lambda: select(BusinessCredit).where(BusinessCredit.business_id == bindparam("bid"))
+)
+_SEL_LENDERS = lambda_stmt(lambda: select(Lender))
+# Plain column rows for read-only checks; skips building ORM instances.
+_SEL_LENDER_ROWS = lambda_stmt(
+    lambda: select(
+        Lender.id,
+        Lender.name,
+        Lender.policy_file,
+        Lender.policy_version,
+        Lender.contact_email,
+        Lender.is_active,
+    )
+)
+
+
+# Raw request bodies, validated once per module by the fixtures below.
+_SAMPLE_REQUEST = {
+    "applicant": {
+        "fico_score": 720,
+        "transunion_score": 715,
+        "experian_score": 710,
+        "equifax_score": 725,
+        "is_homeowner": True,
+        "is_us_citizen": True,
+        "has_cdl": True,
+        "cdl_years": 5,
+        "industry_experience_years": 10,
+    },
+    "business": {
+        "name": "Test Trucking LLC",
+        "state": "TX",
+        "industry_code": "484110",
+        "industry_name": "General Freight Trucking",
+        "years_in_business": 5.0,
+        "annual_revenue": 1500000,
+        "fleet_size": 3,
+    },
+    "credit_history": {
+        "has_bankruptcy": False,
+        "has_foreclosure": False,
+        "has_repossession": False,
+        "has_tax_liens": False,
+        "has_open_judgements": False,
+    },
+    "equipment": {
+        "category": "class_8_truck",
+        "type": "Sleeper",
+        "year": 2022,
+        "mileage": 50000,
+        "condition": "used",
+    },
+    "loan_request": {
+        "amount": 15000000,  # $150,000 in cents
+        "requested_term_months": 60,
+        "down_payment_percent": 10.0,
+        "transaction_type": "purchase",
+        "is_private_party": False,
+    },
+}
+
+_BANKRUPTCY_REQUEST = {
+    "applicant": {"fico_score": 650, "is_homeowner": False},
+    "business": {
+        "name": "Recovery Business Inc",
+        "state": "CA",
+        "years_in_business": 3.0,
+    },
+    "credit_history": {
+        "has_bankruptcy": True,
+        "bankruptcy_discharge_years": 3.5,
+        "bankruptcy_chapter": "7",
+    },
+    "equipment": {"category": "trailer", "year": 2020, "condition": "used"},
+    "loan_request": {"amount": 5000000, "transaction_type": "purchase"},
+}
+
+
+# Request fixtures are module-scoped and shared: ApplicationDBManager only
+# reads them. Tests that need a variation must model_copy(deep=True) first.
+
+
+@pytest.fixture(scope="module")
 def sample_application_request() -> ApplicationSubmitRequest:
     """Create a sample application request for testing."""
-    return ApplicationSubmitRequest(
-        applicant=ApplicantInput(
-            fico_score=720,
-            transunion_score=715,
-            experian_score=710,
-            equifax_score=725,
-            is_homeowner=True,
-            is_us_citizen=True,
-            has_cdl=True,
-            cdl_years=5,
-            industry_experience_years=10,
-        ),
-        business=BusinessInput(
-            name="Test Trucking LLC",
-            state="TX",
-            industry_code="484110",
-            industry_name="General Freight Trucking",
-            years_in_business=5.0,
-            annual_revenue=1500000,
-            fleet_size=3,
-        ),
-        credit_history=CreditHistoryInput(
-            has_bankruptcy=False,
-            has_foreclosure=False,
-            has_repossession=False,
-            has_tax_liens=False,
-            has_open_judgements=False,
-        ),
-        equipment=EquipmentInput(
-            category="class_8_truck",
-            type="Sleeper",
-            year=2022,
-            mileage=50000,
-            condition="used",
-        ),
-        loan_request=LoanRequestInput(
-            amount=15000000,  # $150,000 in cents
-            requested_term_months=60,
-            down_payment_percent=10.0,
-            transaction_type="purchase",
-            is_private_party=False,
-        ),
-    )
+    return ApplicationSubmitRequest.model_validate(_SAMPLE_REQUEST)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_application_with_business_credit(
     sample_application_request: ApplicationSubmitRequest,
 ) -> ApplicationSubmitRequest:
     """Sample application with business credit data."""
-    sample_application_request.business_credit = BusinessCreditInput(
+    request = sample_application_request.model_copy(deep=True)
+    request.business_credit = BusinessCreditInput(
         paynet_score=75,
         paynet_master_score=680,
         paydex_score=80,
     )
-    return sample_application_request
+    return request
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_application_with_bankruptcy() -> ApplicationSubmitRequest:
     """Create a sample application with bankruptcy history."""
-    return ApplicationSubmitRequest(
-        applicant=ApplicantInput(
-            fico_score=650,
-            is_homeowner=False,
-        ),
-        business=BusinessInput(
-            name="Recovery Business Inc",
-            state="CA",
-            years_in_business=3.0,
-        ),
-        credit_history=CreditHistoryInput(
-            has_bankruptcy=True,
-            bankruptcy_discharge_years=3.5,
-            bankruptcy_chapter="7",
-        ),
-        equipment=EquipmentInput(
-            category="trailer",
-            year=2020,
-            condition="used",
-        ),
-        loan_request=LoanRequestInput(
-            amount=5000000,
-            transaction_type="purchase",
-        ),
-    )
+    return ApplicationSubmitRequest.model_validate(_BANKRUPTCY_REQUEST)
+
+
+@pytest.fixture
+def db_manager(test_session: AsyncSession) -> ApplicationDBManager:
+    """ApplicationDBManager bound to the test session."""
+    return ApplicationDBManager(test_session)
+
+
+@pytest.fixture
+def statement_cache_stats(test_engine: AsyncEngine) -> Generator[Counter, None, None]:
+    """Count executed compiled statements and how many hit the statement cache.
+
+    Raw driver SQL (BEGIN, SAVEPOINT) is not compiled and is not counted.
+    """
+    stats: Counter = Counter()
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        if context.compiled is None:
+            return
+        stats["total"] += 1
+        if context.cache_hit == CACHE_HIT:
+            stats["hits"] += 1
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", _count)
+    yield stats
+    event.remove(test_engine.sync_engine, "before_cursor_execute", _count)
+
+
+@pytest.fixture
+def bulk_create_applications(
+    test_session: AsyncSession,
+) -> Callable[[int], Awaitable[list[UUID]]]:
+    """Insert N minimal applications with one multi-row INSERT per table.
+
+    For tests that only need rows to exist; create_application's ORM path is
+    covered by TestApplicationDBManagerCreate. Returns the application IDs.
+    """
+
+    async def _bulk_create(n: int) -> list[UUID]:
+        business_ids = [uuid4() for _ in range(n)]
+        guarantor_ids = [uuid4() for _ in range(n)]
+        application_ids = [uuid4() for _ in range(n)]
+        await test_session.execute(
+            insert(Business),
+            [
+                {
+                    "id": business_id,
+                    "legal_name": f"Business {i}",
+                    "entity_type": "LLC",
+                    "industry_code": "",
+                    "industry_name": "",
+                    "state": "TX",
+                    "city": "",
+                    "zip_code": "",
+                    "years_in_business": 5,
+                }
+                for i, business_id in enumerate(business_ids)
+            ],
+        )
+        await test_session.execute(
+            insert(PersonalGuarantor),
+            [
+                {"id": guarantor_id, "first_name": "Test", "last_name": f"User {i}"}
+                for i, guarantor_id in enumerate(guarantor_ids)
+            ],
+        )
+        await test_session.execute(
+            insert(LoanApplication),
+            [
+                {
+                    "id": application_id,
+                    "business_id": business_id,
+                    "guarantor_id": guarantor_id,
+                    "loan_amount": 15000000,
+                    "transaction_type": "purchase",
+                    "equipment_category": "class_8_truck",
+                    "equipment_type": "Sleeper",
+                    "equipment_year": 2022,
+                    "equipment_condition": "used",
+                }
+                for application_id, business_id, guarantor_id in zip(
+                    application_ids, business_ids, guarantor_ids, strict=True
+                )
+            ],
+        )
+        return application_ids
+
+    return _bulk_create
 
 
+@pytest.mark.xdist_group(name="TestApplicationDBManagerCreate")
 class TestApplicationDBManagerCreate:
     """Tests for ApplicationDBManager.create_application()."""
 
@@ -124,17 +235,15 @@ class TestApplicationDBManagerCreate:
     async def test_creates_business_record(
         self,
         test_session: AsyncSession,
+        db_manager: ApplicationDBManager,
         sample_application_request: ApplicationSubmitRequest,
     ):
         """Should create a Business record with correct data."""
-        service = ApplicationDBManager(test_session)
-
-        application = await service.create_application(sample_application_request)
-        await test_session.commit()
+        application = await db_manager.create_application(sample_application_request)
 
         # Query the business
         result = await test_session.execute(
-            select(Business).where(Business.id == application.business_id)
+            _SEL_BUSINESS, {"bid": application.business_id}
         )
         business = result.scalar_one()
 
@@ -149,19 +258,15 @@ class TestApplicationDBManagerCreate:
     async def test_creates_guarantor_record(
         self,
         test_session: AsyncSession,
+        db_manager: ApplicationDBManager,
         sample_application_request: ApplicationSubmitRequest,
     ):
         """Should create a PersonalGuarantor record with credit scores."""
-        service = ApplicationDBManager(test_session)
-
-        application = await service.create_application(sample_application_request)
-        await test_session.commit()
+        application = await db_manager.create_application(sample_application_request)
 
         # Query the guarantor
         result = await test_session.execute(
-            select(PersonalGuarantor).where(
-                PersonalGuarantor.id == application.guarantor_id
-            )
+            _SEL_GUARANTOR, {"gid": application.guarantor_id}
         )
         guarantor = result.scalar_one()
 
@@ -176,14 +281,11 @@ class TestApplicationDBManagerCreate:
     @pytest.mark.asyncio
     async def test_creates_application_record(
         self,
-        test_session: AsyncSession,
+        db_manager: ApplicationDBManager,
         sample_application_request: ApplicationSubmitRequest,
     ):
         """Should create a LoanApplication record with equipment and loan details."""
-        service = ApplicationDBManager(test_session)
-
-        application = await service.create_application(sample_application_request)
-        await test_session.commit()
+        application = await db_manager.create_application(sample_application_request)
 
         assert application.loan_amount == 15000000
         assert application.requested_term_months == 60
@@ -198,21 +300,17 @@ class TestApplicationDBManagerCreate:
     async def test_creates_business_credit_when_provided(
         self,
         test_session: AsyncSession,
+        db_manager: ApplicationDBManager,
         sample_application_with_business_credit: ApplicationSubmitRequest,
     ):
         """Should create BusinessCredit record when business_credit is provided."""
-        service = ApplicationDBManager(test_session)
-
-        application = await service.create_application(
+        application = await db_manager.create_application(
             sample_application_with_business_credit
         )
-        await test_session.commit()
 
         # Query business credit
         result = await test_session.execute(
-            select(BusinessCredit).where(
-                BusinessCredit.business_id == application.business_id
-            )
+            _SEL_BUSINESS_CREDIT, {"bid": application.business_id}
         )
         business_credit = result.scalar_one()
 
@@ -224,21 +322,17 @@ class TestApplicationDBManagerCreate:
     async def test_handles_bankruptcy_date_conversion(
         self,
         test_session: AsyncSession,
+        db_manager: ApplicationDBManager,
         sample_application_with_bankruptcy: ApplicationSubmitRequest,
     ):
         """Should convert bankruptcy_discharge_years to a date."""
-        service = ApplicationDBManager(test_session)
-
-        application = await service.create_application(
+        application = await db_manager.create_application(
             sample_application_with_bankruptcy
         )
-        await test_session.commit()
 
         # Query the guarantor
         result = await test_session.execute(
-            select(PersonalGuarantor).where(
-                PersonalGuarantor.id == application.guarantor_id
-            )
+            _SEL_GUARANTOR, {"gid": application.guarantor_id}
         )
         guarantor = result.scalar_one()
 
@@ -251,99 +345,83 @@ class TestApplicationDBManagerCreate:
         assert 3.0 <= discharge_years <= 4.0
 
 
+@pytest.mark.xdist_group(name="TestApplicationDBManagerStatus")
 class TestApplicationDBManagerStatus:
     """Tests for ApplicationDBManager status operations."""
 
+    @pytest.mark.parametrize(
+        ("status", "expects_processed_at"),
+        [("processing", False), ("completed", True), ("error", True)],
+    )
     @pytest.mark.asyncio
-    async def test_update_status_to_processing(
-        self,
-        test_session: AsyncSession,
-        sample_application_request: ApplicationSubmitRequest,
-    ):
-        """Should update application status to processing."""
-        service = ApplicationDBManager(test_session)
-
-        application = await service.create_application(sample_application_request)
-        await test_session.commit()
-
-        await service.update_status(application.id, "processing")
-        await test_session.commit()
-
-        # Refresh and check
-        await test_session.refresh(application)
-        assert application.status == "processing"
-
-    @pytest.mark.asyncio
-    async def test_update_status_to_completed(
+    async def test_update_status(
         self,
-        test_session: AsyncSession,
+        db_manager: ApplicationDBManager,
         sample_application_request: ApplicationSubmitRequest,
+        status: str,
+        expects_processed_at: bool,
     ):
-        """Should update application status to completed and set processed_at."""
-        service = ApplicationDBManager(test_session)
+        """Should update status, setting processed_at only for terminal states."""
+        application = await db_manager.create_application(sample_application_request)
 
-        application = await service.create_application(sample_application_request)
-        await test_session.commit()
+        await db_manager.update_status(application.id, status)
 
-        await service.update_status(application.id, "completed")
-        await test_session.commit()
-
-        await test_session.refresh(application)
-        assert application.status == "completed"
-        assert application.processed_at is not None
+        await db_manager.db.refresh(application)
+        assert application.status == status
+        assert (application.processed_at is not None) is expects_processed_at
 
     @pytest.mark.asyncio
-    async def test_update_status_to_error(
+    async def test_update_status_ignores_unknown_status(
         self,
-        test_session: AsyncSession,
+        db_manager: ApplicationDBManager,
         sample_application_request: ApplicationSubmitRequest,
     ):
-        """Should update application status to error and set processed_at."""
-        service = ApplicationDBManager(test_session)
-
-        application = await service.create_application(sample_application_request)
-        await test_session.commit()
+        """Should leave the application unchanged for an unknown status."""
+        application = await db_manager.create_application(sample_application_request)
 
-        await service.update_status(application.id, "error")
-        await test_session.commit()
+        await db_manager.update_status(application.id, "archived")
 
-        await test_session.refresh(application)
-        assert application.status == "error"
-        assert application.processed_at is not None
+        await db_manager.db.refresh(application)
+        assert application.status == "pending"
+        assert application.processed_at is None
 
 
+@pytest.mark.xdist_group(name="TestApplicationDBManagerMatchResults")
 class TestApplicationDBManagerMatchResults:
     """Tests for ApplicationDBManager match result operations."""
 
     @pytest_asyncio.fixture
-    async def lender(self, test_session: AsyncSession) -> Lender:
-        """Create a test lender."""
-        lender = Lender(
-            id="test_lender",
-            name="Test Lender",
-            policy_file="test_lender.yaml",
-            policy_version=1,
+    async def lender(self, test_session: AsyncSession) -> str:
+        """Seed the test lender and return its ID.
+
+        INSERT OR IGNORE keeps the seed idempotent, so it composes with other
+        fixtures that may already have created the same lender.
+        """
+        await test_session.execute(
+            sqlite_insert(Lender)
+            .values(
+                id="test_lender",
+                name="Test Lender",
+                policy_file="test_lender.yaml",
+                policy_version=1,
+            )
+            .on_conflict_do_nothing()
         )
-        test_session.add(lender)
-        await test_session.commit()
-        return lender
+        return "test_lender"
 
     @pytest.mark.asyncio
     async def test_save_eligible_match_results(
         self,
-        test_session: AsyncSession,
+        db_manager: ApplicationDBManager,
         sample_application_request: ApplicationSubmitRequest,
-        lender: Lender,
+        lender: str,
     ):
         """Should save eligible match results with criteria."""
-        service = ApplicationDBManager(test_session)
-
-        application = await service.create_application(sample_application_request)
-        await test_session.commit()
+        application = await db_manager.create_application(sample_application_request)
 
         matches = [
             {
-                "lender_id": "test_lender",
+                "lender_id": lender,
                 "is_eligible": True,
                 "fit_score": 85,
                 "rank": 1,
@@ -363,8 +441,7 @@ class TestApplicationDBManagerMatchResults:
             }
         ]
 
-        results = await service.save_match_results(application.id, matches)
-        await test_session.commit()
+        results = await db_manager.save_match_results(application.id, matches)
 
         assert len(results) == 1
         assert results[0].is_eligible is True
@@ -376,19 +453,16 @@ class TestApplicationDBManagerMatchResults:
     @pytest.mark.asyncio
     async def test_save_ineligible_match_results(
         self,
-        test_session: AsyncSession,
+        db_manager: ApplicationDBManager,
         sample_application_request: ApplicationSubmitRequest,
-        lender: Lender,
+        lender: str,
     ):
         """Should save ineligible match results with rejection reasons."""
-        service = ApplicationDBManager(test_session)
-
-        application = await service.create_application(sample_application_request)
-        await test_session.commit()
+        application = await db_manager.create_application(sample_application_request)
 
         matches = [
             {
-                "lender_id": "test_lender",
+                "lender_id": lender,
                 "is_eligible": False,
                 "fit_score": 0,
                 "rank": None,
@@ -397,8 +471,7 @@ class TestApplicationDBManagerMatchResults:
             }
         ]
 
-        results = await service.save_match_results(application.id, matches)
-        await test_session.commit()
+        results = await db_manager.save_match_results(application.id, matches)
 
         assert len(results) == 1
         assert results[0].is_eligible is False
@@ -410,50 +483,52 @@ class TestApplicationDBManagerMatchResults:
     async def test_get_match_results(
         self,
         test_session: AsyncSession,
+        db_manager: ApplicationDBManager,
         sample_application_request: ApplicationSubmitRequest,
-        lender: Lender,
+        lender: str,
     ):
         """Should retrieve match results for an application."""
-        service = ApplicationDBManager(test_session)
-
-        application = await service.create_application(sample_application_request)
-        await test_session.commit()
+        application = await db_manager.create_application(sample_application_request)
 
         # Create a match result
         match_result = MatchResult(
             application_id=application.id,
-            lender_id="test_lender",
+            lender_id=lender,
             is_eligible=True,
             fit_score=80,
             rank=1,
         )
         test_session.add(match_result)
-        await test_session.commit()
+        await test_session.flush()
 
-        results = await service.get_match_results(application.id)
+        results = await db_manager.get_match_results(application.id)
 
         assert len(results) == 1
         assert results[0].is_eligible is True
         assert results[0].fit_score == 80
 
 
+@pytest.mark.xdist_group(name="TestApplicationDBManagerQuery")
 class TestApplicationDBManagerQuery:
     """Tests for ApplicationDBManager query operations."""
 
     @pytest.mark.asyncio
     async def test_get_application_by_id(
         self,
-        test_session: AsyncSession,
+        db_manager: ApplicationDBManager,
         sample_application_request: ApplicationSubmitRequest,
+        statement_cache_stats: Counter,
     ):
-        """Should retrieve application by ID with relationships."""
-        service = ApplicationDBManager(test_session)
+        """Should retrieve application by ID with relationships eager-loaded."""
+        created = await db_manager.create_application(sample_application_request)
 
-        created = await service.create_application(sample_application_request)
-        await test_session.commit()
+        statement_cache_stats.clear()
+        retrieved = await db_manager.get_application(created.id)
 
-        retrieved = await service.get_application(created.id)
+        # One query for the application plus one per eager-loaded relationship
+        assert statement_cache_stats["total"] == 3
 
+        statement_cache_stats.clear()
         assert retrieved is not None
         assert retrieved.id == created.id
         assert retrieved.business is not None
@@ -461,23 +536,22 @@ class TestApplicationDBManagerQuery:
         assert retrieved.guarantor is not None
         assert retrieved.guarantor.fico_score == 720
 
+        # Reading the relationships must not trigger lazy loads
+        assert statement_cache_stats["total"] == 0
+
     @pytest.mark.asyncio
-    async def test_get_application_not_found(self, test_session: AsyncSession):
+    async def test_get_application_not_found(self, db_manager: ApplicationDBManager):
         """Should return None for non-existent application."""
-        service = ApplicationDBManager(test_session)
-
-        result = await service.get_application(
+        result = await db_manager.get_application(
             UUID("00000000-0000-0000-0000-000000000000")
         )
 
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_list_applications_empty(self, test_session: AsyncSession):
+    async def test_list_applications_empty(self, db_manager: ApplicationDBManager):
         """Should return empty list when no applications exist."""
-        service = ApplicationDBManager(test_session)
-
-        applications, total = await service.list_applications(skip=0, limit=10)
+        applications, total = await db_manager.list_applications(skip=0, limit=10)
 
         assert applications == []
         assert total == 0
@@ -485,59 +559,63 @@ class TestApplicationDBManagerQuery:
     @pytest.mark.asyncio
     async def test_list_applications_with_pagination(
         self,
-        test_session: AsyncSession,
-        sample_application_request: ApplicationSubmitRequest,
+        db_manager: ApplicationDBManager,
+        bulk_create_applications: Callable[[int], Awaitable[list[UUID]]],
+        statement_cache_stats: Counter,
     ):
         """Should return paginated applications."""
-        service = ApplicationDBManager(test_session)
-
-        # Create multiple applications
-        for i in range(5):
-            modified = sample_application_request.model_copy()
-            modified.business.name = f"Business {i}"
-            await service.create_application(modified)
-        await test_session.commit()
+        await bulk_create_applications(5)
 
-        # Get first page
-        applications, total = await service.list_applications(skip=0, limit=2)
+        # Get first page (also warms the statement cache)
+        applications, total = await db_manager.list_applications(skip=0, limit=2)
 
         assert len(applications) == 2
         assert total == 5
 
         # Get second page
-        applications2, total2 = await service.list_applications(skip=2, limit=2)
+        statement_cache_stats.clear()
+        applications2, total2 = await db_manager.list_applications(skip=2, limit=2)
 
         assert len(applications2) == 2
         assert total2 == 5
 
+        # Page and total come from one windowed query, plus the selectinload
+        assert statement_cache_stats["total"] == 2
+        # Repeated page queries must reuse compiled statements
+        assert statement_cache_stats["hits"] / statement_cache_stats["total"] > 0.9
+
     @pytest.mark.asyncio
-    async def test_list_applications_ordered_by_created_at(
+    async def test_list_applications_past_last_page_keeps_total(
         self,
-        test_session: AsyncSession,
-        sample_application_request: ApplicationSubmitRequest,
+        db_manager: ApplicationDBManager,
+        bulk_create_applications: Callable[[int], Awaitable[list[UUID]]],
     ):
-        """Should return applications with correct pagination regardless of order."""
-        service = ApplicationDBManager(test_session)
+        """Should still report the total when the page is past the end."""
+        await bulk_create_applications(3)
 
-        # Create applications
-        app1 = await service.create_application(sample_application_request)
-        await test_session.commit()
+        applications, total = await db_manager.list_applications(skip=10, limit=2)
 
-        modified = sample_application_request.model_copy()
-        modified.business.name = "Second Business"
-        app2 = await service.create_application(modified)
-        await test_session.commit()
+        assert applications == []
+        assert total == 3
 
-        applications, total = await service.list_applications(skip=0, limit=10)
+    @pytest.mark.asyncio
+    async def test_list_applications_ordered_by_created_at(
+        self,
+        db_manager: ApplicationDBManager,
+        bulk_create_applications: Callable[[int], Awaitable[list[UUID]]],
+    ):
+        """Should return applications with correct pagination regardless of order."""
+        created_ids = await bulk_create_applications(2)
+
+        applications, total = await db_manager.list_applications(skip=0, limit=10)
 
         # Both applications should be returned
         assert total == 2
         assert len(applications) == 2
-        app_ids = {a.id for a in applications}
-        assert app1.id in app_ids
-        assert app2.id in app_ids
+        assert {a.id for a in applications} == set(created_ids)
 
 
+@pytest.mark.xdist_group(name="TestApplicationDBManagerSyncLenders")
 class TestApplicationDBManagerSyncLenders:
     """Tests for ApplicationDBManager.sync_lenders()."""
 
@@ -577,53 +655,74 @@ class TestApplicationDBManagerSyncLenders:
     async def test_sync_lenders_creates_new_lenders(
         self,
         test_session: AsyncSession,
+        db_manager: ApplicationDBManager,
         sample_policies: list[LenderPolicy],
     ):
         """Should create new lender records for policies not in DB."""
-        service = ApplicationDBManager(test_session)
-
-        await service.sync_lenders(sample_policies)
-        await test_session.commit()
+        await db_manager.sync_lenders(sample_policies)
 
         # Query all lenders
-        result = await test_session.execute(select(Lender))
-        lenders = {l.id: l for l in result.scalars().all()}
+        rows = (await test_session.execute(_SEL_LENDER_ROWS)).all()
 
-        assert len(lenders) == 2
-        assert "test_lender_1" in lenders
-        assert "test_lender_2" in lenders
+        assert sorted(row.id for row in rows) == ["test_lender_1", "test_lender_2"]
 
         # Check fields
-        lender1 = lenders["test_lender_1"]
+        lender1 = next(row for row in rows if row.id == "test_lender_1")
         assert lender1.name == "Test Lender One"
         assert lender1.policy_file == "test_lender_1.yaml"
         assert lender1.policy_version == 1
         assert lender1.contact_email == "test1@example.com"
         assert lender1.is_active is True
 
+    @pytest.mark.asyncio
+    async def test_sync_lenders_batches_inserts(
+        self,
+        test_engine: AsyncEngine,
+        db_manager: ApplicationDBManager,
+        sample_policies: list[LenderPolicy],
+    ):
+        """Should insert all new lenders with one statement, not one per policy."""
+        lender_inserts: list[bool] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO lenders"):
+                lender_inserts.append(executemany)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            await db_manager.sync_lenders(sample_policies)
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+
+        assert lender_inserts == [True]  # one executemany, not N inserts
+
     @pytest.mark.asyncio
     async def test_sync_lenders_updates_existing_lender_version(
         self,
         test_session: AsyncSession,
+        db_manager: ApplicationDBManager,
         sample_policies: list[LenderPolicy],
     ):
         """Should update existing lender when policy version changes."""
         # Create an existing lender with older version
-        existing = Lender(
-            id="test_lender_1",
-            name="Old Name",
-            policy_file="test_lender_1.yaml",
-            policy_version=0,  # Older version
+        await test_session.execute(
+            insert(Lender),
+            [
+                {
+                    "id": "test_lender_1",
+                    "name": "Old Name",
+                    "policy_file": "test_lender_1.yaml",
+                    "policy_version": 0,  # Older version
+                }
+            ],
         )
-        test_session.add(existing)
-        await test_session.commit()
 
-        service = ApplicationDBManager(test_session)
-        await service.sync_lenders(sample_policies)
-        await test_session.commit()
+        await db_manager.sync_lenders(sample_policies)
 
-        # Refresh and check
-        await test_session.refresh(existing)
+        # Reload from the database and check
+        existing = await test_session.get(
+            Lender, "test_lender_1", populate_existing=True
+        )
         assert existing.policy_version == 1  # Updated
         assert existing.name == "Test Lender One"  # Updated
 
@@ -631,37 +730,40 @@ class TestApplicationDBManagerSyncLenders:
     async def test_sync_lenders_skips_same_version(
         self,
         test_session: AsyncSession,
+        db_manager: ApplicationDBManager,
         sample_policies: list[LenderPolicy],
     ):
         """Should not update lender if version is same."""
         # Create an existing lender with same version
-        existing = Lender(
-            id="test_lender_1",
-            name="Keep This Name",
-            policy_file="test_lender_1.yaml",
-            policy_version=1,  # Same version
+        await test_session.execute(
+            insert(Lender),
+            [
+                {
+                    "id": "test_lender_1",
+                    "name": "Keep This Name",
+                    "policy_file": "test_lender_1.yaml",
+                    "policy_version": 1,  # Same version
+                }
+            ],
         )
-        test_session.add(existing)
-        await test_session.commit()
 
-        service = ApplicationDBManager(test_session)
-        await service.sync_lenders(sample_policies)
-        await test_session.commit()
+        await db_manager.sync_lenders(sample_policies)
 
-        # Refresh and check name wasn't updated
-        await test_session.refresh(existing)
+        # Reload from the database and check name wasn't updated
+        existing = await test_session.get(
+            Lender, "test_lender_1", populate_existing=True
+        )
         assert existing.name == "Keep This Name"  # Not updated
 
     @pytest.mark.asyncio
-    async def test_sync_lenders_empty_list(self, test_session: AsyncSession):
+    async def test_sync_lenders_empty_list(
+        self, test_session: AsyncSession, db_manager: ApplicationDBManager
+    ):
         """Should handle empty policy list without error."""
-        service = ApplicationDBManager(test_session)
-
         # Should not raise
-        await service.sync_lenders([])
-        await test_session.commit()
+        await db_manager.sync_lenders([])
 
         # No lenders created
-        result = await test_session.execute(select(Lender))
+        result = await test_session.execute(_SEL_LENDERS)
         lenders = list(result.scalars().all())
         assert len(lenders) == 0
@@ -16,13 +16,17 @@ from app.rules.base import EvaluationContext
 from app.rules.engine import MatchingEngine, LenderMatchResult, ProgramMatchResult
 
 
-@pytest.fixture
+# The engine is stateless and the policies and EvaluationContext (frozen) are
+# only read by evaluate_lender, so one instance of each is shared.
+
+
+@pytest.fixture(scope="session")
 def engine():
     """Create a matching engine instance."""
     return MatchingEngine()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def basic_context():
     """Create a basic evaluation context."""
     return EvaluationContext(
@@ -39,7 +43,7 @@ def basic_context():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_policy():
     """Create a simple lender policy."""
     return LenderPolicy(
@@ -61,6 +65,56 @@ def simple_policy():
     )
 
 
+@pytest.fixture(scope="module")
+def tx_excluded_policy():
+    """Create a policy whose only restriction excludes Texas."""
+    return LenderPolicy(
+        id="test_lender",
+        name="Test Lender",
+        version=1,
+        programs=[
+            LenderProgram(
+                id="standard",
+                name="Standard Program",
+                criteria=ProgramCriteria(),
+            ),
+        ],
+        restrictions=LenderRestrictions(
+            geographic=GeographicCriteria(excluded_states=["TX"]),  # Context is TX
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def tiered_policy():
+    """Create a policy with two FICO tiers covering overlapping amounts."""
+    return LenderPolicy(
+        id="test_lender",
+        name="Test Lender",
+        version=1,
+        programs=[
+            LenderProgram(
+                id="tier_1",
+                name="Tier 1 - Best Rates",
+                min_amount=5000000,  # $50,000
+                max_amount=10000000,
+                criteria=ProgramCriteria(
+                    credit_score=CreditScoreCriteria(type="fico", min=750),
+                ),
+            ),
+            LenderProgram(
+                id="tier_2",
+                name="Tier 2 - Standard",
+                min_amount=1000000,
+                max_amount=7500000,
+                criteria=ProgramCriteria(
+                    credit_score=CreditScoreCriteria(type="fico", min=700),
+                ),
+            ),
+        ],
+    )
+
+
 class TestEvaluateLenderEligible:
     """Tests for eligible lender evaluations."""
 
@@ -108,25 +162,11 @@ class TestEvaluateLenderIneligibleCreditScore:
 class TestEvaluateLenderIneligibleState:
     """Tests for ineligible due to state restriction."""
 
-    def test_evaluate_lender_ineligible_state(self, engine, basic_context):
+    def test_evaluate_lender_ineligible_state(
+        self, engine, basic_context, tx_excluded_policy
+    ):
         """Test evaluation fails when state is excluded."""
-        policy = LenderPolicy(
-            id="test_lender",
-            name="Test Lender",
-            version=1,
-            programs=[
-                LenderProgram(
-                    id="standard",
-                    name="Standard Program",
-                    criteria=ProgramCriteria(),
-                ),
-            ],
-            restrictions=LenderRestrictions(
-                geographic=GeographicCriteria(excluded_states=["TX"]),  # Context is TX
-            ),
-        )
-
-        result = engine.evaluate_lender(basic_context, policy)
+        result = engine.evaluate_lender(basic_context, tx_excluded_policy)
 
         assert result.is_eligible is False
         assert len(result.global_rejection_reasons) > 0
@@ -136,35 +176,11 @@ class TestEvaluateLenderIneligibleState:
 class TestEvaluateLenderMultipleProgramsBestMatch:
     """Tests for selecting best program from multiple options."""
 
-    def test_evaluate_lender_multiple_programs_best_match(self, engine, basic_context):
+    def test_evaluate_lender_multiple_programs_best_match(
+        self, engine, basic_context, tiered_policy
+    ):
         """Test best program is selected when multiple are eligible."""
-        policy = LenderPolicy(
-            id="test_lender",
-            name="Test Lender",
-            version=1,
-            programs=[
-                LenderProgram(
-                    id="tier_1",
-                    name="Tier 1 - Best Rates",
-                    min_amount=5000000,  # $50,000
-                    max_amount=10000000,
-                    criteria=ProgramCriteria(
-                        credit_score=CreditScoreCriteria(type="fico", min=750),
-                    ),
-                ),
-                LenderProgram(
-                    id="tier_2",
-                    name="Tier 2 - Standard",
-                    min_amount=1000000,
-                    max_amount=7500000,
-                    criteria=ProgramCriteria(
-                        credit_score=CreditScoreCriteria(type="fico", min=700),
-                    ),
-                ),
-            ],
-        )
-
-        result = engine.evaluate_lender(basic_context, policy)
+        result = engine.evaluate_lender(basic_context, tiered_policy)
 
         # Should be eligible for tier_2 (720 >= 700) but not tier_1 (720 < 750)
         assert result.is_eligible is True
@@ -205,6 +221,51 @@ class TestEvaluateLenderRejectionReasons:
         assert len(result.best_program.rejection_reasons) >= 2
 
 
+class TestEvaluateLenderBusinessFailures:
+    """Tests for reporting business requirement failures."""
+
+    def test_all_failed_business_checks_reported(self, engine):
+        """Test every failed business check appears in the criteria result."""
+        context = EvaluationContext(
+            application_id="test-app",
+            fico_score=720,
+            years_in_business=0.5,  # Too short
+            is_homeowner=False,  # Homeowner required
+            loan_amount=5000000,
+        )
+        policy = LenderPolicy(
+            id="test_lender",
+            name="Test Lender",
+            version=1,
+            programs=[
+                LenderProgram(
+                    id="standard",
+                    name="Standard",
+                    criteria=ProgramCriteria(
+                        business=BusinessCriteria(
+                            min_time_in_business_years=2,
+                            requires_homeowner=True,
+                        ),
+                    ),
+                ),
+            ],
+        )
+
+        result = engine.evaluate_lender(context, policy)
+
+        business_result = next(
+            r
+            for r in result.best_program.criteria_results
+            if r.rule_name == "Business Requirements"
+        )
+        assert business_result.passed is False
+        failed_checks = business_result.details["failed_checks"]
+        assert len(failed_checks) == 2
+        assert business_result.required_value == "; ".join(
+            check["required"] for check in failed_checks
+        )
+
+
 class TestEvaluateLenderProgramAmountBounds:
     """Tests for program amount bounds checking."""
 
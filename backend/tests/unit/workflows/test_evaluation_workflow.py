@@ -4,23 +4,54 @@ import pytest
 from pathlib import Path
 
 from app.core.hatchet import MockHatchetContext
+from app.policies.loader import PolicyLoader
+from app.policies.schema import LenderPolicy
 from app.workflows.evaluation import ApplicationEvaluationWorkflow
 
 
 LENDERS_DIR = Path(__file__).parent.parent.parent.parent / "app" / "policies" / "lenders"
 
 
+class _PreloadedPolicyLoader(PolicyLoader):
+    """PolicyLoader serving policies that were parsed up front.
+
+    PolicyLoader re-reads YAML on every call. The tests never modify the
+    policy files or the loaded policies, so the parsed results can be reused.
+    """
+
+    def __init__(self, policies: dict[str, LenderPolicy]):
+        super().__init__(LENDERS_DIR)
+        self._policies = policies
+
+    def get_all_lender_ids(self) -> list[str]:
+        return list(self._policies)
+
+    def load_policy(self, lender_id: str) -> LenderPolicy:
+        try:
+            return self._policies[lender_id]
+        except KeyError:
+            return super().load_policy(lender_id)
+
+
+@pytest.fixture(scope="module")
+def workflow() -> ApplicationEvaluationWorkflow:
+    """Workflow over the real lender policies, parsed once per module."""
+    loader = PolicyLoader(LENDERS_DIR)
+    policies = {
+        lender_id: loader.load_policy(lender_id)
+        for lender_id in loader.get_all_lender_ids()
+    }
+    return ApplicationEvaluationWorkflow(
+        policy_loader=_PreloadedPolicyLoader(policies)
+    )
+
+
 class TestEvaluationWorkflowComplete:
     """Tests for the complete evaluation workflow."""
 
     @pytest.mark.asyncio
-    async def test_full_workflow_success(self):
+    async def test_full_workflow_success(self, workflow):
         """Test complete workflow with valid application."""
-        from app.policies.loader import PolicyLoader
-
-        policy_loader = PolicyLoader(LENDERS_DIR)
-        workflow = ApplicationEvaluationWorkflow(policy_loader=policy_loader)
-
         application_data = {
             "application_id": "test-123",
             "fico_score": 720,
@@ -61,13 +92,8 @@ class TestEvaluateAllLenders:
     """Tests for the evaluate all lenders step."""
 
     @pytest.mark.asyncio
-    async def test_evaluate_returns_all_lenders(self):
+    async def test_evaluate_returns_all_lenders(self, workflow):
         """Test evaluation returns results for all lenders."""
-        from app.policies.loader import PolicyLoader
-
-        policy_loader = PolicyLoader(LENDERS_DIR)
-        workflow = ApplicationEvaluationWorkflow(policy_loader=policy_loader)
-
         context = MockHatchetContext({
             "application_data": {
                 "application_id": "test-123",
@@ -1,226 +1,92 @@
 """Unit tests for application validation step."""
 
+from types import MappingProxyType
+
 import pytest
 
 from app.core.hatchet import MockHatchetContext
 from app.workflows.evaluation import validate_application
 
 
-class TestValidateCompleteApplication:
-    """Tests for validating complete applications."""
-
-    @pytest.mark.asyncio
-    async def test_validate_complete_application(self):
-        """Test validation passes for complete application."""
-        context = MockHatchetContext({
-            "application_data": {
-                "fico_score": 720,
-                "state": "TX",
-                "loan_amount": 5000000,
-                "equipment_category": "construction",
-            }
-        })
-
-        result = await validate_application(context)
-
-        assert result["is_valid"] is True
-        assert len(result["errors"]) == 0
-        assert "validated_at" in result
-
-
-class TestValidateMissingFicoScore:
-    """Tests for missing FICO score."""
-
-    @pytest.mark.asyncio
-    async def test_validate_missing_fico_score(self):
-        """Test validation fails when FICO score is missing."""
-        context = MockHatchetContext({
-            "application_data": {
-                "state": "TX",
-                "loan_amount": 5000000,
-                "equipment_category": "construction",
-            }
-        })
-
-        result = await validate_application(context)
-
-        assert result["is_valid"] is False
-        errors = result["errors"]
-        assert any(e["field"] == "fico_score" for e in errors)
-
-
-class TestValidateMissingState:
-    """Tests for missing state."""
-
-    @pytest.mark.asyncio
-    async def test_validate_missing_state(self):
-        """Test validation fails when state is missing."""
-        context = MockHatchetContext({
-            "application_data": {
-                "fico_score": 720,
-                "loan_amount": 5000000,
-                "equipment_category": "construction",
-            }
-        })
-
-        result = await validate_application(context)
-
-        assert result["is_valid"] is False
-        errors = result["errors"]
-        assert any(e["field"] == "state" for e in errors)
-
-    @pytest.mark.asyncio
-    async def test_validate_empty_state(self):
-        """Test validation fails when state is empty string."""
-        context = MockHatchetContext({
-            "application_data": {
-                "fico_score": 720,
-                "state": "",
-                "loan_amount": 5000000,
-                "equipment_category": "construction",
-            }
-        })
-
-        result = await validate_application(context)
-
-        assert result["is_valid"] is False
-
-
-class TestValidateMissingLoanAmount:
-    """Tests for missing loan amount."""
-
-    @pytest.mark.asyncio
-    async def test_validate_missing_loan_amount(self):
-        """Test validation fails when loan amount is missing."""
-        context = MockHatchetContext({
-            "application_data": {
-                "fico_score": 720,
-                "state": "TX",
-                "equipment_category": "construction",
-            }
-        })
-
-        result = await validate_application(context)
-
-        assert result["is_valid"] is False
-        errors = result["errors"]
-        assert any(e["field"] == "loan_amount" for e in errors)
-
-
-class TestValidateMissingEquipmentCategory:
-    """Tests for missing equipment category."""
-
-    @pytest.mark.asyncio
-    async def test_validate_missing_equipment_category(self):
-        """Test validation fails when equipment category is missing."""
-        context = MockHatchetContext({
-            "application_data": {
-                "fico_score": 720,
-                "state": "TX",
-                "loan_amount": 5000000,
-            }
-        })
-
-        result = await validate_application(context)
-
-        assert result["is_valid"] is False
-        errors = result["errors"]
-        assert any(e["field"] == "equipment_category" for e in errors)
-
-
-class TestValidateMultipleErrors:
-    """Tests for multiple validation errors."""
-
-    @pytest.mark.asyncio
-    async def test_validate_multiple_errors(self):
-        """Test validation returns all errors when multiple fields missing."""
-        context = MockHatchetContext({
-            "application_data": {}
-        })
-
-        result = await validate_application(context)
-
-        assert result["is_valid"] is False
-        errors = result["errors"]
-        # Should have errors for all required fields
-        assert len(errors) == 4
-        error_fields = {e["field"] for e in errors}
-        assert error_fields == {"fico_score", "state", "loan_amount", "equipment_category"}
-
-
-class TestValidateFicoRange:
-    """Tests for FICO score range validation."""
-
-    @pytest.mark.asyncio
-    async def test_validate_fico_below_minimum(self):
-        """Test validation fails when FICO is below 300."""
-        context = MockHatchetContext({
-            "application_data": {
-                "fico_score": 200,
-                "state": "TX",
-                "loan_amount": 5000000,
-                "equipment_category": "construction",
-            }
-        })
-
-        result = await validate_application(context)
-
-        assert result["is_valid"] is False
-        errors = result["errors"]
-        assert any("300" in e["message"] for e in errors)
-
-    @pytest.mark.asyncio
-    async def test_validate_fico_above_maximum(self):
-        """Test validation fails when FICO is above 850."""
-        context = MockHatchetContext({
-            "application_data": {
-                "fico_score": 900,
-                "state": "TX",
-                "loan_amount": 5000000,
-                "equipment_category": "construction",
-            }
-        })
-
-        result = await validate_application(context)
-
-        assert result["is_valid"] is False
-        errors = result["errors"]
-        assert any("850" in e["message"] for e in errors)
-
-
-class TestValidateLoanAmountRange:
-    """Tests for loan amount validation."""
-
-    @pytest.mark.asyncio
-    async def test_validate_negative_loan_amount(self):
-        """Test validation fails for negative loan amount."""
-        context = MockHatchetContext({
-            "application_data": {
-                "fico_score": 720,
-                "state": "TX",
-                "loan_amount": -5000,
-                "equipment_category": "construction",
-            }
-        })
-
-        result = await validate_application(context)
-
-        assert result["is_valid"] is False
-        errors = result["errors"]
-        assert any(e["field"] == "loan_amount" for e in errors)
-
-    @pytest.mark.asyncio
-    async def test_validate_zero_loan_amount(self):
-        """Test validation fails for zero loan amount."""
-        context = MockHatchetContext({
-            "application_data": {
-                "fico_score": 720,
-                "state": "TX",
-                "loan_amount": 0,
-                "equipment_category": "construction",
-            }
-        })
-
-        result = await validate_application(context)
-
-        assert result["is_valid"] is False
+COMPLETE_APPLICATION = MappingProxyType({
+    "fico_score": 720,
+    "state": "TX",
+    "loan_amount": 5000000,
+    "equipment_category": "construction",
+})
+
+
+def _application(**changes):
+    """The complete application with fields replaced, or dropped when None."""
+    data = dict(COMPLETE_APPLICATION)
+    for field, value in changes.items():
+        if value is None:
+            del data[field]
+        else:
+            data[field] = value
+    return data
+
+
+async def _validate(application_data):
+    context = MockHatchetContext({"application_data": application_data})
+    return await validate_application(context)
+
+
+INVALID_CASES = [
+    # Missing or blank required fields
+    pytest.param(_application(fico_score=None), "fico_score", "", id="missing_fico"),
+    pytest.param(_application(state=None), "state", "", id="missing_state"),
+    pytest.param(_application(state=""), "state", "", id="empty_state"),
+    pytest.param(
+        _application(loan_amount=None), "loan_amount", "", id="missing_loan_amount"
+    ),
+    pytest.param(
+        _application(equipment_category=None),
+        "equipment_category",
+        "",
+        id="missing_equipment_category",
+    ),
+    # FICO score range
+    pytest.param(_application(fico_score=200), "fico_score", "300", id="fico_low"),
+    pytest.param(_application(fico_score=900), "fico_score", "850", id="fico_high"),
+    # Loan amount must be positive
+    pytest.param(
+        _application(loan_amount=-5000), "loan_amount", "", id="negative_loan"
+    ),
+    pytest.param(_application(loan_amount=0), "loan_amount", "", id="zero_loan"),
+]
+
+
+@pytest.mark.asyncio
+async def test_validate_complete_application():
+    """Test validation passes for complete application."""
+    result = await _validate(dict(COMPLETE_APPLICATION))
+
+    assert result["is_valid"] is True
+    assert len(result["errors"]) == 0
+    assert "validated_at" in result
+
+
+@pytest.mark.parametrize(("application_data", "field", "in_message"), INVALID_CASES)
+@pytest.mark.asyncio
+async def test_validate_invalid_application(application_data, field, in_message):
+    """Test validation fails with an error on the offending field."""
+    result = await _validate(application_data)
+
+    assert result["is_valid"] is False
+    assert any(
+        e["field"] == field and in_message in e["message"] for e in result["errors"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_validate_multiple_errors():
+    """Test validation returns all errors when multiple fields missing."""
+    result = await _validate({})
+
+    assert result["is_valid"] is False
+    errors = result["errors"]
+    # Should have errors for all required fields
+    assert len(errors) == 4
+    error_fields = {e["field"] for e in errors}
+    assert error_fields == {"fico_score", "state", "loan_amount", "equipment_category"}